@@ -10,17 +10,19 @@ Modifications and refactoring for Coglet by Andreas Fatum, 2025.
 from __future__ import annotations
 
 import logging
+import math
 import os
+import queue
 import random
 import threading
 import time
 import traceback
 from dataclasses import dataclass, field
-from typing import Generator, Iterable, Optional, Sequence, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-from hardware.pca9685_servo import Servo
+from hardware.pca9685_servo import Servo, flush_servos
 
-from .grove_vision_ai import FaceDetectionBox, GroveVisionAIClient
+from .grove_vision_ai import FaceDetectionBatch, FaceDetectionBox, GroveVisionAIClient
 from logging_setup import get_logger, setup_logging
 
 setup_logging()
@@ -47,7 +49,7 @@ def _get_env_bool(key: str, default: bool) -> bool:
     return val in ("1", "true", "yes", "on")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FaceTrackingServos:
     """Bundle of servos that should follow the detected face."""
 
@@ -66,7 +68,7 @@ class FaceTrackingServos:
         yield from self.wheels
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FaceTrackingConfig:
     """Tunable parameters to map detection coordinates to servo movements.
     Values are loaded from environment variables if available.
@@ -90,8 +92,15 @@ class FaceTrackingConfig:
 
     invoke_interval_s: float = _get_env_float("FACE_TRACKING_INVOKE_INTERVAL_S", 0.15)
     invoke_timeout_s: float = _get_env_float("FACE_TRACKING_INVOKE_TIMEOUT_S", 0.25)
+    # Upper bound the invoke interval backs off to while no face is seen.
+    idle_invoke_interval_s: float = _get_env_float("FACE_TRACKING_IDLE_INVOKE_INTERVAL_S", 1.0)
     update_interval_s: float = _get_env_float("FACE_TRACKING_UPDATE_INTERVAL_S", 0.02)
     neutral_timeout_s: float = _get_env_float("FACE_TRACKING_NEUTRAL_TIMEOUT_S", 2.0)
+    # Weight of the newest detection in the exponential moving average of the
+    # face center (1.0 disables smoothing).
+    center_smoothing_alpha: float = _get_env_float("FACE_TRACKING_CENTER_SMOOTHING_ALPHA", 0.4)
+    # Keep following the face that overlaps the previous pick by more than this IoU.
+    track_iou_threshold: float = _get_env_float("FACE_TRACKING_TRACK_IOU_THRESHOLD", 0.3)
 
     wheel_deadzone_deg: float = _get_env_float("FACE_TRACKING_WHEEL_DEADZONE_DEG", 5.0)
     wheel_follow_delay_s: float = _get_env_float("FACE_TRACKING_WHEEL_FOLLOW_DELAY_S", 0.8)
@@ -112,13 +121,53 @@ class FaceTrackingConfig:
     patrol_range_eyes_deg: float = _get_env_float("FACE_TRACKING_PATROL_RANGE_EYES_DEG", 25.0)
     patrol_range_pitch_deg: float = _get_env_float("FACE_TRACKING_PATROL_RANGE_PITCH_DEG", 15.0)
 
-    @property
-    def frame_center_x(self) -> float:
-        return self.frame_width / 2.0
+    frame_center_x: float = field(init=False)
+    frame_center_y: float = field(init=False)
 
-    @property
-    def frame_center_y(self) -> float:
-        return self.frame_height / 2.0
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "frame_center_x", self.frame_width / 2.0)
+        object.__setattr__(self, "frame_center_y", self.frame_height / 2.0)
+
+
+# Number of intervals in the wheel-follow lookup table (257 samples).
+_WHEEL_LUT_STEPS = 256
+
+
+def _build_patrol_table(cfg: FaceTrackingConfig) -> Tuple[List[Tuple[float, float, float, float]], int]:
+    """Flatten the patrol script into ``(wheel, eye, pitch, end_time)`` rows.
+
+    Offsets are relative to each servo's neutral angle; ``end_time`` is the
+    cumulative time in seconds since the patrol started at which the pose
+    is left for the next row. Also returns the index of the first phase-2 row.
+    """
+    wheels = cfg.patrol_range_wheels_deg
+    eyes = cfg.patrol_range_eyes_deg
+    pitch = cfg.patrol_range_pitch_deg
+
+    def nod(wheel: float, eye: float) -> List[Tuple[float, float, float, float]]:
+        return [(wheel, eye, pitch, 0.35), (wheel, eye, -pitch, 0.35), (wheel, eye, 0.0, 0.35)]
+
+    # Phase 1 looks left, phase 2 right, then the head sweeps back to center.
+    phase1 = [
+        (0.0, -eyes, 0.0, 0.6),
+        (wheels, -eyes, 0.0, 1.5),
+        *nod(wheels, -eyes),
+    ]
+    steps = [
+        *phase1,
+        (wheels, eyes, 0.0, 0.6),
+        (-wheels, eyes, 0.0, 1.8),
+        *nod(-wheels, eyes),
+        (-wheels, -eyes, 0.0, 0.6),
+        (0.0, -eyes, 0.0, 1.2),
+        (0.0, 0.0, 0.0, 0.6),
+    ]
+    table = []
+    end_time = 0.0
+    for wheel, eye, pitch_offset, hold in steps:
+        end_time += hold
+        table.append((wheel, eye, pitch_offset, end_time))
+    return table, len(phase1)
 
 
 class FaceTracker:
@@ -135,22 +184,60 @@ class FaceTracker:
             raise ValueError("At least one eye servo is required for face tracking")
         self._client = client
         self._servos = servos
+        self._eyes_tuple: Tuple[Servo, ...] = tuple(servos.eyes)
+        self._eye_count = len(self._eyes_tuple)
+        self._eye_neutral_mean = sum(s.config.neutral_deg for s in self._eyes_tuple) / self._eye_count
+        self._wheels_tuple: Tuple[Servo, ...] = tuple(servos.wheels)
+        self._pitch_servo: Optional[Servo] = servos.pitch
+        self._all_servos_tuple: Tuple[Servo, ...] = tuple(servos.all_servos())
         self._config = config or FaceTrackingConfig()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        # Vision requests run on a helper thread so servo ticks continue while
+        # the board is inferring; at most one request is in flight.
+        self._vision_thread: Optional[threading.Thread] = None
+        self._vision_request = threading.Event()
+        self._vision_results: "queue.Queue[Optional[Sequence[FaceDetectionBox]]]" = queue.Queue(maxsize=1)
+        # Set by the vision thread when a result is queued and by stop(); lets
+        # the control loop sleep until the next servo tick or the next event.
+        self._wake = threading.Event()
         self._last_detection: float = 0.0
         self._last_face: Optional[FaceDetectionBox] = None
-        self._lock = threading.Lock()
+        self._ema_cx: Optional[float] = None
+        self._ema_cy: Optional[float] = None
+        # Seqlock for the published tracking state: only the tracker thread
+        # writes, bumping the counter to odd before and back to even after.
+        self._state_seq = 0
         self._wheel_trigger_time: Optional[float] = None
         self._wheel_active = False
-        self._patrol_gen: Optional[Generator[None, None, None]] = None
+        self._at_neutral = False
+        # Index into ``_patrol_table`` of the pose currently held; None while no patrol runs.
+        self._patrol_idx: Optional[int] = None
+        self._patrol_start = 0.0
         self._last_patrol_finish = time.monotonic()
         self._patrol_detection_count = 0
+        # Consecutive empty vision results and the invoke interval derived from them.
+        self._miss_count = 0
+        self._dyn_interval = self._config.invoke_interval_s
+        # The config is frozen, so derived values can be computed once here.
+        cfg = self._config
+        self._wheel_in_range = cfg.wheel_input_max_deg - cfg.wheel_input_min_deg
+        self._wheel_out_range = cfg.wheel_output_max_deg - cfg.wheel_output_min_deg
+        self._frame_center_x = cfg.frame_center_x
+        self._frame_center_y = cfg.frame_center_y
+        self._patrol_table, self._patrol_phase2_idx = _build_patrol_table(cfg)
+        self._wheel_lut = self._build_wheel_lut()
 
     def start(self) -> None:
         if self._thread is not None:
             return
         self._stop_event.clear()
+        self._vision_request.clear()
+        self._wake.clear()
+        while not self._vision_results.empty():
+            self._vision_results.get_nowait()
+        self._vision_thread = threading.Thread(target=self._vision_loop, name="FaceTrackerVision", daemon=True)
+        self._vision_thread.start()
         self._thread = threading.Thread(target=self._run, name="FaceTracker", daemon=True)
         self._thread.start()
         logger.info("Face tracker started. Patrol=%s (Interval=%.1fs, ConfirmFrames=%d)",
@@ -158,254 +245,361 @@ class FaceTracker:
                     self._config.patrol_interval_s,
                     self._config.patrol_confirm_frames)
 
+    def tracking_state(self) -> Tuple[float, Optional[FaceDetectionBox]]:
+        """Return ``(last_detection_time, last_face)`` as one consistent pair.
+
+        Safe to call from any thread; retries while the tracker thread is in
+        the middle of publishing a new detection.
+        """
+        while True:
+            seq = self._state_seq
+            if not seq & 1:
+                state = (self._last_detection, self._last_face)
+                if self._state_seq == seq:
+                    return state
+            time.sleep(0)
+
     def stop(self, *, join_timeout: float = 1.0) -> None:
         if self._thread is None:
             return
         self._stop_event.set()
+        self._vision_request.set()
+        self._wake.set()
         self._thread.join(timeout=join_timeout)
         self._thread = None
+        if self._vision_thread is not None:
+            self._vision_thread.join(timeout=join_timeout)
+            self._vision_thread = None
         logger.info("Face tracker thread stopped")
 
 
     def _run(self) -> None:
         cfg = self._config
         next_invoke = 0.0
-        last_update = time.monotonic()
+        awaiting_result = False
+        # Servo physics runs on a fixed step against absolute deadlines, so
+        # wakeups for vision results or sleep jitter do not change the tick.
+        tick_s = cfg.update_interval_s
+        next_update = time.monotonic()
 
 
         self._last_detection = time.monotonic()
         self._last_patrol_finish = time.monotonic()
         self._patrol_detection_count = 0
+        self._miss_count = 0
+        self._dyn_interval = cfg.invoke_interval_s
 
-        while not self._stop_event.is_set():
+        while True:
+            wait_s = tick_s
             try:
                 now = time.monotonic()
-                dt = now - last_update
-                last_update = now
-                self._update_servos(dt)
-
-                if now >= next_invoke:
-
-                    boxes = self._client.invoke_once(timeout=cfg.invoke_timeout_s)
-
-
-                    if boxes:
-                        if self._patrol_gen is not None:
-                            self._patrol_detection_count += 1
-                            if self._patrol_detection_count < cfg.patrol_confirm_frames:
-
-                                if logger.isEnabledFor(logging.DEBUG):
-                                    logger.debug(f"Patrol: Potential face masked ({self._patrol_detection_count}/{cfg.patrol_confirm_frames})")
-                                boxes = []
-                            else:
-
-                                logger.info("Face confirmed during patrol. Aborting patrol.")
-                                self._patrol_gen = None
-                                self._patrol_detection_count = 0
-                        else:
-
-                            self._patrol_detection_count = 0
+                if now >= next_update:
+                    self._update_servos(tick_s)
+                    next_update += tick_s
+                    if next_update <= now:
+                        # Fell more than a tick behind; resync instead of bursting catch-up ticks.
+                        next_update = now + tick_s
+
+                if not awaiting_result and now >= next_invoke:
+                    self._vision_request.set()
+                    awaiting_result = True
+                    next_invoke = now + self._dyn_interval
+
+                if awaiting_result:
+                    try:
+                        boxes = self._vision_results.get_nowait()
+                    except queue.Empty:
+                        pass
                     else:
+                        awaiting_result = False
+                        self._process_vision_result(boxes, now)
+                        # The request went out with the previous interval; apply a
+                        # shorter one (face found, patrol started) right away.
+                        next_invoke = min(next_invoke, now + self._dyn_interval)
 
-                        self._patrol_detection_count = 0
-
+                deadline = next_update if awaiting_result else min(next_update, next_invoke)
+                wait_s = max(0.0, deadline - time.monotonic())
 
-                    if boxes:
-
-                        self._handle_detection(boxes, timestamp=now)
-                        self._last_patrol_finish = now
+            except Exception as e:
+                logger.error(f"FaceTracker loop crashed (recovering): {e}")
+                traceback.print_exc()
+                wait_s = 1.0
+
+            # Sleeps until the next servo tick, but wakes early for a vision
+            # result so it is handled without waiting out the tick.
+            if self._wake.wait(wait_s):
+                self._wake.clear()
+                if self._stop_event.is_set():
+                    break
+
+    def _vision_loop(self) -> None:
+        timeout = self._config.invoke_timeout_s
+        while True:
+            self._vision_request.wait()
+            self._vision_request.clear()
+            if self._stop_event.is_set():
+                return
+            try:
+                boxes = self._client.invoke_once(timeout=timeout)
+            except Exception as e:
+                logger.error(f"Face tracker vision request failed: {e}")
+                boxes = None
+            self._vision_results.put(boxes)
+            self._wake.set()
 
+    def _process_vision_result(self, boxes: Optional[Sequence[FaceDetectionBox]], now: float) -> None:
+        cfg = self._config
+        # Back off exponentially while idle; any box or a running patrol restores the full rate.
+        if boxes or self._patrol_idx is not None:
+            self._miss_count = 0
+            self._dyn_interval = cfg.invoke_interval_s
+        else:
+            self._miss_count += 1
+            backoff = cfg.invoke_interval_s * (1.5 ** min(self._miss_count, 6))
+            self._dyn_interval = max(cfg.invoke_interval_s, min(cfg.idle_invoke_interval_s, backoff))
+        if boxes:
+            if self._patrol_idx is not None:
+                self._patrol_detection_count += 1
+                if self._patrol_detection_count < cfg.patrol_confirm_frames:
+
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Patrol: Potential face masked ({self._patrol_detection_count}/{cfg.patrol_confirm_frames})")
+                    boxes = []
+                else:
+
+                    logger.info("Face confirmed during patrol. Aborting patrol.")
+                    self._patrol_idx = None
+                    self._patrol_detection_count = 0
+            else:
+
+                self._patrol_detection_count = 0
+        else:
+
+            self._patrol_detection_count = 0
+
+
+        if boxes:
+
+            self._handle_detection(boxes, timestamp=now)
+            self._last_patrol_finish = now
+
+        else:
+
+            time_since_detection = now - self._last_detection
+
+            if self._patrol_idx is not None:
+
+                table = self._patrol_table
+                if now - self._patrol_start >= table[self._patrol_idx][3]:
+                    self._patrol_idx += 1
+                    if self._patrol_idx < len(table):
+                        wheel_offset, eye_offset, pitch_offset, _ = table[self._patrol_idx]
+                        if self._patrol_idx == self._patrol_phase2_idx:
+                            logger.info(f"Patrol: Phase 2 (Right). Eye Offset: {eye_offset}")
+                        self._patrol_set_pose(wheel_offset, eye_offset, pitch_offset)
                     else:
+                        self._patrol_idx = None
+                        self._last_patrol_finish = now
+                        logger.debug("Patrol finished sequence.")
+                        self._move_all_to_neutral()
 
-                        time_since_detection = now - self._last_detection
-
-                        if self._patrol_gen is not None:
-
-                            try:
-                                next(self._patrol_gen)
-                            except StopIteration:
-
-                                self._patrol_gen = None
-                                self._last_patrol_finish = now
-                                logger.debug("Patrol finished sequence.")
-                                self._move_all_to_neutral()
-                            except Exception as e:
-                                logger.error(f"Patrol generator crashed: {e}")
-                                traceback.print_exc()
-                                self._patrol_gen = None
-                                self._move_all_to_neutral()
-
-                        elif time_since_detection > cfg.neutral_timeout_s:
-
-
-                            time_since_patrol = now - self._last_patrol_finish
-                            if cfg.patrol_enabled and time_since_patrol > cfg.patrol_interval_s:
-                                logger.info("Starting patrol scan...")
-                                self._patrol_gen = self._create_patrol_sequence()
-                            else:
+            elif time_since_detection > cfg.neutral_timeout_s:
 
-                                self._handle_missing_detection(now)
 
-                        else:
+                time_since_patrol = now - self._last_patrol_finish
+                if cfg.patrol_enabled and time_since_patrol > cfg.patrol_interval_s:
+                    logger.info("Starting patrol scan...")
+                    logger.info(f"Patrol: Phase 1 (Left). Eye Offset: {-cfg.patrol_range_eyes_deg}")
+                    self._patrol_idx = 0
+                    self._patrol_start = now
+                    # Patrol rows advance on vision results, so drop the idle backoff.
+                    self._miss_count = 0
+                    self._dyn_interval = cfg.invoke_interval_s
+                    wheel_offset, eye_offset, pitch_offset, _ = self._patrol_table[0]
+                    self._patrol_set_pose(wheel_offset, eye_offset, pitch_offset)
+                else:
 
-                            self._handle_missing_detection(now)
+                    self._handle_missing_detection(now)
 
-                    next_invoke = now + cfg.invoke_interval_s
+            else:
 
-                time.sleep(cfg.update_interval_s)
-
-            except Exception as e:
-                logger.error(f"FaceTracker loop crashed (recovering): {e}")
-                traceback.print_exc()
-                time.sleep(1.0)
+                self._handle_missing_detection(now)
 
     def _update_servos(self, dt: float) -> None:
-        for servo in self._servos.all_servos():
-            servo.update(dt)
+        # Servos on a shared PCA9685Bus go out as a single I²C block write per tick.
+        flush_servos(self._all_servos_tuple, dt)
 
     def _move_all_to_neutral(self):
         """Force all tracking servos to neutral immediately."""
-        for servo in self._servos.all_servos():
+        for servo in self._all_servos_tuple:
             servo.move_to(servo.config.neutral_deg)
+        self._at_neutral = True
 
 
-    def _create_patrol_sequence(self) -> Generator[None, None, None]:
-        cfg = self._config
-
-        def wait_seconds(sec: float):
-            end = time.monotonic() + sec
-            while time.monotonic() < end:
-                yield
-
-        def set_pose(wheel_offset=0.0, eye_offset=0.0, pitch_offset=0.0):
-
-            for w in self._servos.wheels:
-                w.move_to(w.config.neutral_deg + wheel_offset)
-
-
-            for i, e in enumerate(self._servos.eyes):
-                target = e.config.neutral_deg + eye_offset
-                if logger.isEnabledFor(logging.DEBUG):
-
-                    logger.debug(f"Patrol Eye[{i}]: Neutral {e.config.neutral_deg:.1f} + Offset {eye_offset:.1f} = {target:.1f} (Limits: {e.config.min_angle_deg:.1f}/{e.config.max_angle_deg:.1f})")
-                e.move_to(target)
-
-
-            if self._servos.pitch:
-                p = self._servos.pitch
-                p.move_to(p.config.neutral_deg + pitch_offset)
-
-        def nod_up_down(wheel_offset: float, eye_offset: float) -> Generator[None, None, None]:
-            """Pitch up and down while keeping wheel/eye offsets constant."""
-            pitch_range = cfg.patrol_range_pitch_deg
-            set_pose(wheel_offset=wheel_offset, eye_offset=eye_offset, pitch_offset=pitch_range)
-            yield from wait_seconds(0.35)
-            set_pose(wheel_offset=wheel_offset, eye_offset=eye_offset, pitch_offset=-pitch_range)
-            yield from wait_seconds(0.35)
-            set_pose(wheel_offset=wheel_offset, eye_offset=eye_offset, pitch_offset=0.0)
-            yield from wait_seconds(0.35)
-
-        logger.info(f"Patrol: Phase 1 (Left). Eye Offset: {-cfg.patrol_range_eyes_deg}")
-
-
-        set_pose(wheel_offset=0.0, eye_offset=-cfg.patrol_range_eyes_deg)
-        yield from wait_seconds(0.6)
-
-
-        set_pose(wheel_offset=cfg.patrol_range_wheels_deg, eye_offset=-cfg.patrol_range_eyes_deg)
-        yield from wait_seconds(1.5)
-
-
-        yield from nod_up_down(cfg.patrol_range_wheels_deg, -cfg.patrol_range_eyes_deg)
-
-        logger.info(f"Patrol: Phase 2 (Right). Eye Offset: {cfg.patrol_range_eyes_deg}")
-
-
-        set_pose(wheel_offset=cfg.patrol_range_wheels_deg, eye_offset=cfg.patrol_range_eyes_deg)
-        yield from wait_seconds(0.6)
-
-
-        set_pose(wheel_offset=-cfg.patrol_range_wheels_deg, eye_offset=cfg.patrol_range_eyes_deg)
-        yield from wait_seconds(1.8)
-
-
-        yield from nod_up_down(-cfg.patrol_range_wheels_deg, cfg.patrol_range_eyes_deg)
+    def _patrol_set_pose(
+        self,
+        wheel_offset: float = 0.0,
+        eye_offset: float = 0.0,
+        pitch_offset: float = 0.0,
+    ) -> None:
+        self._at_neutral = False
 
+        for w in self._wheels_tuple:
+            w.move_to(w.config.neutral_deg + wheel_offset)
 
-        set_pose(wheel_offset=-cfg.patrol_range_wheels_deg, eye_offset=-cfg.patrol_range_eyes_deg)
-        yield from wait_seconds(0.6)
 
+        for i, e in enumerate(self._eyes_tuple):
+            target = e.config.neutral_deg + eye_offset
+            if logger.isEnabledFor(logging.DEBUG):
 
-        set_pose(wheel_offset=0.0, eye_offset=-cfg.patrol_range_eyes_deg)
-        yield from wait_seconds(1.2)
+                logger.debug(f"Patrol Eye[{i}]: Neutral {e.config.neutral_deg:.1f} + Offset {eye_offset:.1f} = {target:.1f} (Limits: {e.config.min_angle_deg:.1f}/{e.config.max_angle_deg:.1f})")
+            e.move_to(target)
 
 
-        set_pose(wheel_offset=0.0, eye_offset=0.0)
-        yield from wait_seconds(0.6)
+        p = self._pitch_servo
+        if p is not None:
+            p.move_to(p.config.neutral_deg + pitch_offset)
 
     def _handle_detection(self, boxes: Sequence[FaceDetectionBox], *, timestamp: float) -> None:
-        best = self._select_best_box(boxes)
+        best, tracked = self._select_best_box(boxes, self._last_face)
         if best is None:
             self._handle_missing_detection(timestamp)
             return
+        if not tracked:
+            # A different face: blending from the old center would aim between the two.
+            self._ema_cx = self._ema_cy = None
 
         cfg = self._config
         cx, cy = self._extract_center(best)
-        error_x = cx - cfg.frame_center_x
-        error_y = cy - cfg.frame_center_y
-
-        with self._lock:
-
-            for servo in self._servos.eyes:
-                if abs(error_x) > cfg.eye_deadzone_px:
-                    delta = self._clamp(error_x * cfg.eye_gain_deg_per_px, cfg.eye_max_delta_deg)
-                    servo.move_to(servo.target_deg + delta)
-            if self._servos.yaw is not None and abs(error_x) > cfg.yaw_deadzone_px:
-                delta = self._clamp(error_x * cfg.yaw_gain_deg_per_px, cfg.yaw_max_delta_deg)
-                self._servos.yaw.move_to(self._servos.yaw.target_deg + delta)
-            if self._servos.pitch is not None and abs(error_y) > cfg.pitch_deadzone_px:
-                delta = self._clamp(error_y * cfg.pitch_gain_deg_per_px, cfg.pitch_max_delta_deg)
-                self._servos.pitch.move_to(self._servos.pitch.target_deg + delta)
-            self._update_wheels(timestamp, error_x)
-            self._last_detection = timestamp
-            self._last_face = best
+        # Smooth the center over recent detections to keep noisy boxes from
+        # jittering the servos.
+        alpha = cfg.center_smoothing_alpha
+        if self._ema_cx is None or self._ema_cy is None:
+            self._ema_cx, self._ema_cy = cx, cy
+        else:
+            self._ema_cx = alpha * cx + (1.0 - alpha) * self._ema_cx
+            self._ema_cy = alpha * cy + (1.0 - alpha) * self._ema_cy
+        error_x = self._ema_cx - self._frame_center_x
+        error_y = self._ema_cy - self._frame_center_y
+
+        # Publish the tracking state before issuing any servo commands.
+        self._state_seq += 1
+        self._last_detection = timestamp
+        self._last_face = best
+        self._state_seq += 1
+        self._at_neutral = False
+
+        # Clamps are inlined: this runs for every detection inside the control loop.
+        if abs(error_x) > cfg.eye_deadzone_px:
+            raw = error_x * cfg.eye_gain_deg_per_px
+            limit = cfg.eye_max_delta_deg
+            delta = limit if raw > limit else (-limit if raw < -limit else raw)
+            for servo in self._eyes_tuple:
+                servo.move_to(servo.target_deg + delta)
+        yaw = self._servos.yaw
+        if yaw is not None and abs(error_x) > cfg.yaw_deadzone_px:
+            raw = error_x * cfg.yaw_gain_deg_per_px
+            limit = cfg.yaw_max_delta_deg
+            delta = limit if raw > limit else (-limit if raw < -limit else raw)
+            yaw.move_to(yaw.target_deg + delta)
+        pitch = self._pitch_servo
+        if pitch is not None and abs(error_y) > cfg.pitch_deadzone_px:
+            raw = error_y * cfg.pitch_gain_deg_per_px
+            limit = cfg.pitch_max_delta_deg
+            delta = limit if raw > limit else (-limit if raw < -limit else raw)
+            pitch.move_to(pitch.target_deg + delta)
+        self._update_wheels(timestamp, error_x)
 
     def _handle_missing_detection(self, now: float) -> None:
         if (now - self._last_detection) < self._config.neutral_timeout_s:
             return
 
 
-        if self._patrol_gen is None:
-            for servo in self._servos.all_servos():
+        # Neutralise only on the transition; repeating it every tick while idle
+        # just rewrites identical targets.
+        if self._patrol_idx is None and not self._at_neutral:
+            for servo in self._all_servos_tuple:
                 servo.move_to(servo.config.neutral_deg)
             self._reset_wheel_follow()
+            self._at_neutral = True
 
+        self._state_seq += 1
         self._last_face = None
+        self._state_seq += 1
+        self._ema_cx = None
+        self._ema_cy = None
 
-    def _select_best_box(self, boxes: Sequence[FaceDetectionBox]) -> Optional[FaceDetectionBox]:
-        if not boxes:
-            return None
-        return max(
-            boxes,
-            key=lambda box: ((box.score or 0.0), box.width * box.height),
-        )
+    def _select_best_box(
+        self,
+        boxes: Sequence[FaceDetectionBox],
+        prev: Optional[FaceDetectionBox] = None,
+    ) -> Tuple[Optional[FaceDetectionBox], bool]:
+        """Pick the face to follow; returns ``(box, tracked)``.
+
+        If ``prev`` (the face followed last frame) overlaps one of the boxes by
+        more than ``track_iou_threshold``, the best-overlapping box wins so the
+        tracker does not flip between faces with similar scores, and ``tracked``
+        is True. Otherwise the highest score (then largest area) is chosen.
+        """
+        if prev is not None:
+            tracked: Optional[FaceDetectionBox] = None
+            best_iou = self._config.track_iou_threshold
+            for box in boxes:
+                iou = self._iou(box, prev)
+                if iou > best_iou:
+                    tracked = box
+                    best_iou = iou
+            if tracked is not None:
+                return tracked, True
+
+        # A single face is by far the common case and needs no ranking.
+        if len(boxes) == 1:
+            return boxes[0], False
+
+        if isinstance(boxes, FaceDetectionBatch):
+            index = boxes.best_index()
+            return (None if index is None else boxes[index]), False
+
+        # Hand-rolled scan: same ordering as max(key=(score, area)) but without
+        # a lambda call and a key tuple per box.
+        best: Optional[FaceDetectionBox] = None
+        best_score = float("-inf")
+        best_area = float("-inf")
+        for box in boxes:
+            score = box.score or 0.0
+            area = box.width * box.height
+            if score > best_score or (score == best_score and area > best_area):
+                best = box
+                best_score = score
+                best_area = area
+        return best, False
+
+    def _iou(self, a: FaceDetectionBox, b: FaceDetectionBox) -> float:
+        ax1, ay1 = a.x, a.y
+        bx1, by1 = b.x, b.y
+        if self._config.coordinates_are_center:
+            ax1 -= a.width / 2.0
+            ay1 -= a.height / 2.0
+            bx1 -= b.width / 2.0
+            by1 -= b.height / 2.0
+        inter_w = min(ax1 + a.width, bx1 + b.width) - max(ax1, bx1)
+        inter_h = min(ay1 + a.height, by1 + b.height) - max(ay1, by1)
+        if inter_w <= 0.0 or inter_h <= 0.0:
+            return 0.0
+        inter = inter_w * inter_h
+        union = a.width * a.height + b.width * b.height - inter
+        return inter / union if union > 0.0 else 0.0
 
     def _extract_center(self, box: FaceDetectionBox) -> Tuple[float, float]:
         if self._config.coordinates_are_center:
             return box.x, box.y
         return box.center_x, box.center_y
 
-    @staticmethod
-    def _clamp(value: float, max_delta: float) -> float:
-        return max(-max_delta, min(max_delta, value))
-
     def _average_eye_target(self) -> float:
-        if not self._servos.eyes:
-            return 0.0
-        return sum(servo.target_deg for servo in self._servos.eyes) / len(self._servos.eyes)
+        return sum(servo.target_deg for servo in self._eyes_tuple) / self._eye_count
 
     def _update_wheels(self, timestamp: float, error_x: float) -> None:
-        wheels = self._servos.wheels
+        wheels = self._wheels_tuple
         if not wheels:
             return
         cfg = self._config
@@ -413,8 +607,7 @@ class FaceTracker:
             self._reset_wheel_follow()
             return
         eye_target = self._average_eye_target()
-        eye_neutral = sum(servo.config.neutral_deg for servo in self._servos.eyes) / len(self._servos.eyes)
-        deviation = abs(eye_target - eye_neutral)
+        deviation = abs(eye_target - self._eye_neutral_mean)
         if deviation <= cfg.wheel_deadzone_deg:
             self._reset_wheel_follow()
             return
@@ -428,7 +621,7 @@ class FaceTracker:
         self._wheel_active = True
 
     def _reset_wheel_follow(self) -> None:
-        wheels = self._servos.wheels
+        wheels = self._wheels_tuple
         if not wheels:
             return
         self._wheel_trigger_time = None
@@ -437,35 +630,56 @@ class FaceTracker:
                 wheel.move_to(wheel.config.neutral_deg)
             self._wheel_active = False
 
-    def _map_eye_to_wheel_target(self, eye_target: float) -> float:
+    def _build_wheel_lut(self) -> Tuple[float, ...]:
+        """Sample ``_power_map`` over the wheel input range for ``_map_eye_to_wheel_target``."""
         cfg = self._config
-        return self._power_map(
-            eye_target,
-            cfg.wheel_input_min_deg,
-            cfg.wheel_input_max_deg,
-            cfg.wheel_output_min_deg,
-            cfg.wheel_output_max_deg,
-            cfg.wheel_power,
+        steps = _WHEEL_LUT_STEPS
+        return tuple(
+            self._power_map(
+                cfg.wheel_input_min_deg + self._wheel_in_range * i / steps,
+                cfg.wheel_input_min_deg,
+                self._wheel_in_range,
+                cfg.wheel_output_min_deg,
+                self._wheel_out_range,
+                cfg.wheel_power,
+            )
+            for i in range(steps + 1)
         )
 
+    def _map_eye_to_wheel_target(self, eye_target: float) -> float:
+        # Linear interpolation in the precomputed table avoids a float pow() per detection.
+        lut = self._wheel_lut
+        if self._wheel_in_range == 0.0:
+            return lut[0]
+        t = (eye_target - self._config.wheel_input_min_deg) / self._wheel_in_range * _WHEEL_LUT_STEPS
+        if t <= 0.0:
+            return lut[0]
+        if t >= _WHEEL_LUT_STEPS:
+            return lut[-1]
+        i = int(t)
+        return lut[i] + (t - i) * (lut[i + 1] - lut[i])
+
     @staticmethod
     def _power_map(
         value: float,
         in_min: float,
-        in_max: float,
+        in_range: float,
         out_min: float,
-        out_max: float,
+        out_range: float,
         power: float,
     ) -> float:
-        """Non-linear remapping of offsets (adapted from Will Cogley's mini bot code)."""
-        if in_max == in_min:
-            return (out_min + out_max) / 2.0
-        norm = (value - in_min) / (in_max - in_min)
+        """Non-linear remapping of offsets (adapted from Will Cogley's mini bot code).
+
+        ``in_range``/``out_range`` are ``max - min`` of the respective interval.
+        """
+        if in_range == 0.0:
+            return out_min + out_range / 2.0
+        norm = (value - in_min) / in_range
         norm = max(0.0, min(1.0, norm))
         norm = (norm * 2.0) - 1.0
-        curved = (abs(norm) ** power) * (1.0 if norm >= 0.0 else -1.0)
+        curved = math.copysign(abs(norm) ** power, norm)
         curved = (curved + 1.0) / 2.0
-        return out_min + (out_max - out_min) * curved
+        return out_min + out_range * curved
 
 
 __all__ = ["FaceTracker", "FaceTrackingServos", "FaceTrackingConfig"]
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import math
+import operator
+import selectors
 import threading
 import time
+from collections import deque
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Iterator, List, Optional, Sequence, Union, overload
 
 from logging_setup import get_logger, setup_logging
 
@@ -18,6 +23,22 @@ try:
 except ImportError:
     serial = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses the bytes frames directly and is noticeably faster on the small
+# result objects; its JSONDecodeError subclasses ValueError like json's does.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_GET_XY = operator.itemgetter("x", "y")
+
 
 @dataclass(slots=True)
 class FaceDetectionBox:
@@ -42,13 +63,17 @@ class FaceDetectionBox:
         """Create an instance from a payload returned by the board."""
 
         if isinstance(payload, dict):
-            x = float(payload.get("x", 0.0))
-            y = float(payload.get("y", 0.0))
-            width = float(payload.get("w", payload.get("width", 0.0)))
-            height = float(payload.get("h", payload.get("height", 0.0)))
-            score_value = payload.get("score", payload.get("confidence"))
+            try:
+                x, y = _GET_XY(payload)
+            except KeyError:
+                x = payload.get("x", 0.0)
+                y = payload.get("y", 0.0)
+            # Look up the alias only when the short key is missing.
+            width = payload["w"] if "w" in payload else payload.get("width", 0.0)
+            height = payload["h"] if "h" in payload else payload.get("height", 0.0)
+            score_value = payload["score"] if "score" in payload else payload.get("confidence")
             score = float(score_value) if score_value is not None else None
-            return cls(x=x, y=y, width=width, height=height, score=score)
+            return cls(x=float(x), y=float(y), width=float(width), height=float(height), score=score)
 
         data = list(payload)
         if len(data) < 4:
@@ -58,6 +83,91 @@ class FaceDetectionBox:
         return cls(x=float(x), y=float(y), width=float(width), height=float(height), score=score)
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class FaceDetectionBatch(SequenceABC):
+    """All boxes of one frame as a struct-of-arrays ``float64`` matrix.
+
+    Built when the board reports boxes as plain lists (``[x, y, w, h, score, ...]``).
+    Columns are exposed as ndarray views; indexing or iterating yields
+    ``FaceDetectionBox`` objects lazily, so the batch can be used wherever a
+    sequence of boxes is expected. Missing scores are stored as NaN.
+    """
+
+    data: "np.ndarray"
+
+    @classmethod
+    def from_raw(cls, boxes_raw: Sequence[Sequence[float | int | None]]) -> Optional["FaceDetectionBatch"]:
+        """Return a batch for rectangular list-of-lists payloads, else ``None``."""
+
+        if np is None:
+            return None
+        try:
+            raw = np.asarray(boxes_raw, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        if raw.ndim != 2 or raw.shape[1] < 4:
+            return None
+        data = np.full((raw.shape[0], 5), np.nan, dtype=np.float64)
+        columns = min(raw.shape[1], 5)
+        data[:, :columns] = raw[:, :columns]
+        return cls(data)
+
+    @property
+    def xs(self) -> "np.ndarray":
+        return self.data[:, 0]
+
+    @property
+    def ys(self) -> "np.ndarray":
+        return self.data[:, 1]
+
+    @property
+    def ws(self) -> "np.ndarray":
+        return self.data[:, 2]
+
+    @property
+    def hs(self) -> "np.ndarray":
+        return self.data[:, 3]
+
+    @property
+    def scores(self) -> "np.ndarray":
+        return self.data[:, 4]
+
+    def best_index(self) -> Optional[int]:
+        """Index of the highest score (missing = 0), ties broken by the larger area."""
+
+        if len(self) == 0:
+            return None
+        scores = np.nan_to_num(self.scores, nan=0.0)
+        candidates = np.flatnonzero(scores == scores.max())
+        areas = self.ws[candidates] * self.hs[candidates]
+        return int(candidates[int(np.argmax(areas))])
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    @overload
+    def __getitem__(self, index: int) -> FaceDetectionBox: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[FaceDetectionBox]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[FaceDetectionBox, List[FaceDetectionBox]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        x, y, width, height, score = self.data[index].tolist()
+        return FaceDetectionBox(
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            score=None if math.isnan(score) else score,
+        )
+
+    def __iter__(self) -> Iterator[FaceDetectionBox]:
+        for index in range(len(self)):
+            yield self[index]
+
+
 class GroveVisionAIClient:
     """Communicates with the Grove Vision AI v2 board via USB serial."""
 
@@ -78,33 +188,78 @@ class GroveVisionAIClient:
                 raise RuntimeError("pyserial is required to use GroveVisionAIClient")
             self._serial = serial.Serial(port=port, baudrate=baudrate, timeout=read_timeout)
         self._lock = threading.Lock()
-        self._buffer = bytearray()
+        # Chunks of the frame currently being received, already scanned.
+        self._frame_chunks: deque[bytes] = deque()
         self._brace_depth = 0
+        # Unscanned bytes that followed the last returned frame.
+        self._pending = b""
+        # Waiting on the descriptor leaves the port timeout (and its termios
+        # state) alone; ports without one fall back to a temporary timeout.
+        self._selector: Optional[selectors.BaseSelector] = None
+        try:
+            fd = self._serial.fileno()
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+        except Exception as exc:
+            logger.debug("Serial port has no selectable descriptor: %s", exc)
+        else:
+            self._selector = selector
+
+    def set_low_latency(self, enabled: bool = True) -> bool:
+        """Toggle the kernel's ``ASYNC_LOW_LATENCY`` flag on the serial port.
+
+        On USB serial adapters with a latency timer (e.g. FTDI, 16 ms by
+        default) this lets reads wake as soon as bytes arrive. Returns
+        ``False`` if the port or driver does not support it.
+        """
+
+        setter = getattr(self._serial, "set_low_latency_mode", None)
+        if setter is None:
+            return False
+        with self._lock:
+            try:
+                setter(enabled)
+            except (ValueError, OSError) as exc:
+                logger.debug("Could not change low-latency mode: %s", exc)
+                return False
+        return True
 
     def close(self) -> None:
         with self._lock:
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
             try:
                 self._serial.close()
             except Exception as exc:
                 logger.debug("Failed to close serial port cleanly: %s", exc)
 
-    def invoke_once(self, *, timeout: float = 0.3) -> Optional[List[FaceDetectionBox]]:
+    def invoke_once(self, *, timeout: float = 0.3) -> Optional[Sequence[FaceDetectionBox]]:
         """Trigger a single inference and return detected bounding boxes."""
 
         deadline = time.monotonic() + timeout
         with self._lock:
             self._flush_input()
+            self._reset_framer()
             try:
                 self._serial.write(self._INVOCATION_COMMAND)
             except Exception as exc:
                 logger.error("Failed to send invoke command: %s", exc)
                 return None
 
-            while time.monotonic() < deadline:
-                boxes = self._read_available()
+            # Blocking reads let the kernel wake us when bytes arrive instead
+            # of polling the port every few milliseconds.
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0.0:
+                    break
+                try:
+                    boxes = self._read_available(remaining)
+                except Exception as exc:
+                    logger.error("Error while reading from Vision board: %s", exc)
+                    return None
                 if boxes is not None:
                     return boxes
-                time.sleep(0.005)
         logger.debug("invoke_once timed out after %.3f s", timeout)
         return None
 
@@ -121,55 +276,102 @@ class GroveVisionAIClient:
         except Exception as exc:
             logger.debug("Failed to flush input buffer: %s", exc)
 
-    def _read_available(self) -> Optional[List[FaceDetectionBox]]:
-        try:
-            to_read = getattr(self._serial, "in_waiting", 0) or 1
-            raw = self._serial.read(to_read)
-        except Exception as exc:
-            logger.error("Error while reading from Vision board: %s", exc)
-            return None
+    def _read_available(self, timeout: float) -> Optional[Sequence[FaceDetectionBox]]:
+        """Read what is buffered, or block up to ``timeout`` for the next byte."""
+
+        waiting = self._serial.in_waiting
+        if waiting:
+            raw = self._serial.read(waiting)
+        elif self._selector is not None:
+            if not self._selector.select(timeout):
+                return None
+            waiting = self._serial.in_waiting
+            if not waiting:
+                return None
+            raw = self._serial.read(waiting)
+        else:
+            previous = self._serial.timeout
+            self._serial.timeout = timeout
+            try:
+                raw = self._serial.read(1)
+            finally:
+                self._serial.timeout = previous
         if not raw:
             return None
+        return self._extract_boxes(raw)
 
-        boxes = self._extract_boxes(raw)
-        if boxes is None:
-            return None
-        return boxes
+    def _reset_framer(self) -> None:
+        self._frame_chunks.clear()
+        self._brace_depth = 0
+        self._pending = b""
+
+    def _extract_boxes(self, chunk: bytes) -> Optional[Sequence[FaceDetectionBox]]:
+        """Feed ``chunk`` into the JSON framer and return boxes of the first result frame.
 
-    def _extract_boxes(self, chunk: bytes) -> Optional[List[FaceDetectionBox]]:
-        for byte in chunk:
-            if byte == ord("{"):
-                if self._brace_depth == 0:
-                    self._buffer.clear()
-                self._brace_depth += 1
-                self._buffer.append(byte)
-                continue
+        Chunks are scanned in place with ``bytes.find``/``count`` and only kept
+        while a top-level object is open; they are joined once when the object
+        closes. Bytes after a returned frame stay buffered for the next call.
+        """
 
+        if self._pending:
+            chunk = self._pending + chunk
+            self._pending = b""
+        while chunk:
+            pos = 0
             if self._brace_depth == 0:
-                continue
-
-            self._buffer.append(byte)
-            if byte == ord("{"):
-                self._brace_depth += 1
-            elif byte == ord("}"):
-                self._brace_depth -= 1
-                if self._brace_depth == 0:
-                    try:
-                        obj = json.loads(self._buffer.decode("utf-8"))
-                    except json.JSONDecodeError:
-                        logger.debug("Discarding malformed JSON payload: %r", self._buffer)
-                        self._buffer.clear()
-                        continue
-                    self._buffer.clear()
-                    if not isinstance(obj, dict):
-                        continue
-                    if obj.get("type") != 1:
-                        continue
-                    data = obj.get("data", {})
-                    boxes_raw = data.get("boxes", [])
-                    boxes = [FaceDetectionBox.from_payload(entry) for entry in boxes_raw]
-                    return boxes
+                start = chunk.find(b"{")
+                if start == -1:
+                    return None
+                if start:
+                    chunk = chunk[start:]
+                self._brace_depth = 1
+                pos = 1
+
+            end = self._scan_braces(chunk, pos)
+            if end == -1:
+                self._frame_chunks.append(chunk)
+                return None
+
+            self._frame_chunks.append(chunk[:end])
+            frame = b"".join(self._frame_chunks)
+            self._frame_chunks.clear()
+            chunk = chunk[end:]
+            boxes = self._parse_frame(frame)
+            if boxes is not None:
+                self._pending = chunk
+                return boxes
         return None
 
+    def _scan_braces(self, chunk: bytes, pos: int) -> int:
+        """Track brace depth through ``chunk[pos:]``; return the index after the closing brace or -1."""
+
+        while True:
+            close_idx = chunk.find(b"}", pos)
+            if close_idx == -1:
+                self._brace_depth += chunk.count(b"{", pos)
+                return -1
+            self._brace_depth += chunk.count(b"{", pos, close_idx) - 1
+            pos = close_idx + 1
+            if self._brace_depth == 0:
+                return pos
+
+    def _parse_frame(self, frame: bytes) -> Optional[Sequence[FaceDetectionBox]]:
+        try:
+            obj = _json_loads(frame)
+        except ValueError:
+            logger.debug("Discarding malformed JSON payload: %r", frame)
+            return None
+        if not isinstance(obj, dict):
+            return None
+        if obj.get("type") != 1:
+            return None
+        data = obj.get("data", {})
+        boxes_raw = data.get("boxes", [])
+        if boxes_raw and not isinstance(boxes_raw[0], dict):
+            batch = FaceDetectionBatch.from_raw(boxes_raw)
+            if batch is not None:
+                return batch
+        return [FaceDetectionBox.from_payload(entry) for entry in boxes_raw]
+
 
-__all__ = ["FaceDetectionBox", "GroveVisionAIClient"]
+__all__ = ["FaceDetectionBatch", "FaceDetectionBox", "GroveVisionAIClient"]
@@ -2,22 +2,41 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
+import math
+import os
+import queue
+import selectors
 import signal
 import sys
+import threading
 import time
-from typing import Iterable
+from typing import List, Optional, Sequence, Tuple
 
 try:
 
-    from .grove_vision_ai import FaceDetectionBox, GroveVisionAIClient
+    from .grove_vision_ai import FaceDetectionBatch, FaceDetectionBox, GroveVisionAIClient
 except ImportError:
 
-    from grove_vision_ai import FaceDetectionBox, GroveVisionAIClient
+    from grove_vision_ai import FaceDetectionBatch, FaceDetectionBox, GroveVisionAIClient
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+# Deadlines slipping further than this many periods are resynchronised.
+_MAX_LAG_PERIODS = 3
+
 def _build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
@@ -47,11 +66,21 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         default=0.4,
         help="Timeout in seconds while waiting for a detection result (default: %(default)s)",
     )
+    parser.add_argument(
+        "--low-latency",
+        action="store_true",
+        help="Set ASYNC_LOW_LATENCY on the serial port so reads are not delayed by the USB latency timer",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Print detection results as JSON instead of a human readable summary",
     )
+    parser.add_argument(
+        "--msgpack",
+        action="store_true",
+        help="Write detection results as a binary msgpack stream for another process (requires msgpack)",
+    )
     parser.add_argument(
         "--max-iterations",
         type=int,
@@ -74,46 +103,225 @@ def _configure_logging(level: str) -> None:
     )
 
 
-def _boxes_to_json(boxes: Iterable[FaceDetectionBox]) -> str:
+@functools.lru_cache(maxsize=4)
+def _format_second(second: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Wall-clock label for output lines; strftime runs once per second at most."""
+
+    return _format_second(int(timestamp))
+
+
+_DETECTION_KEYS = ("x", "y", "width", "height", "score", "center_x", "center_y")
+
+_DetectionRow = Tuple[float, float, float, float, Optional[float], float, float]
+
+
+def _detection_rows(boxes: Sequence[FaceDetectionBox]) -> List[_DetectionRow]:
+    """``(x, y, width, height, score, center_x, center_y)`` per detection.
+
+    A ``FaceDetectionBatch`` is converted column-wise with one ``tolist()`` per
+    column, without creating ``FaceDetectionBox`` objects.
+    """
+
+    if isinstance(boxes, FaceDetectionBatch):
+        data = boxes.data
+        centers_x = data[:, 0] + data[:, 2] / 2.0
+        centers_y = data[:, 1] + data[:, 3] / 2.0
+        scores = [None if math.isnan(score) else score for score in data[:, 4].tolist()]
+        return list(
+            zip(
+                data[:, 0].tolist(),
+                data[:, 1].tolist(),
+                data[:, 2].tolist(),
+                data[:, 3].tolist(),
+                scores,
+                centers_x.tolist(),
+                centers_y.tolist(),
+            )
+        )
+    return [
+        (box.x, box.y, box.width, box.height, box.score, box.center_x, box.center_y)
+        for box in boxes
+    ]
+
+
+def _boxes_to_json(boxes: Sequence[FaceDetectionBox], timestamp: Optional[float] = None) -> str:
     payload = {
-        "timestamp": time.time(),
-        "detections": [
-            {
-                "x": box.x,
-                "y": box.y,
-                "width": box.width,
-                "height": box.height,
-                "score": box.score,
-                "center_x": box.center_x,
-                "center_y": box.center_y,
-            }
-            for box in boxes
-        ],
+        "timestamp": time.time() if timestamp is None else timestamp,
+        "detections": [dict(zip(_DETECTION_KEYS, row)) for row in _detection_rows(boxes)],
     }
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
     return json.dumps(payload)
 
 
-def _print_boxes_human_readable(boxes: Iterable[FaceDetectionBox]) -> None:
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    boxes_list = list(boxes)
-    if not boxes_list:
+def _boxes_to_msgpack(boxes: Sequence[FaceDetectionBox], timestamp: float) -> bytes:
+    """Pack one frame as ``{"t": timestamp, "d": [(x, y, w, h, score), ...]}``.
+
+    Consumers read the stream with ``msgpack.Unpacker``; frames are
+    self-delimiting, so no separators are written.
+    """
+
+    return msgpack.packb({"t": timestamp, "d": [row[:5] for row in _detection_rows(boxes)]})
+
+
+def _print_boxes_human_readable(boxes: Sequence[FaceDetectionBox], timestamp: Optional[float] = None) -> None:
+    timestamp = _format_timestamp(time.time() if timestamp is None else timestamp)
+    if not boxes:
         print(f"[{timestamp}] No detections received from the Grove Vision board.")
         return
+    rows = _detection_rows(boxes)
 
-    print(f"[{timestamp}] {len(boxes_list)} Detections")
-    for idx, box in enumerate(boxes_list, start=1):
-        score_display = f"{box.score:.3f}" if box.score is not None else "n/a"
-        print(
-            f"  #{idx}: score={score_display} x={box.x:.1f} y={box.y:.1f} "
-            f"w={box.width:.1f} h={box.height:.1f} cx={box.center_x:.1f} cy={box.center_y:.1f}"
+    # One write and flush per frame instead of one print per detection.
+    lines = [f"[{timestamp}] {len(rows)} Detections"]
+    for idx, (x, y, width, height, score, center_x, center_y) in enumerate(rows, start=1):
+        score_display = f"{score:.3f}" if score is not None else "n/a"
+        lines.append(
+            f"  #{idx}: score={score_display} x={x:.1f} y={y:.1f} "
+            f"w={width:.1f} h={height:.1f} cx={center_x:.1f} cy={center_y:.1f}"
         )
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
+
+
+def _print_results(results: "queue.Queue[Optional[Tuple[float, Optional[Sequence[FaceDetectionBox]]]]]", output: str) -> None:
+    """Format and print queued results until the ``None`` sentinel arrives.
+
+    Stops early if writing fails (e.g. a closed pipe); the main loop notices
+    through ``Thread.is_alive``.
+    """
+
+    as_json = output == "json"
+    binary_out = sys.stdout.buffer if output == "msgpack" else None
+    while True:
+        item = results.get()
+        if item is None:
+            return
+        timestamp, boxes = item
+        try:
+            if binary_out is not None:
+                # Timeouts are sent as empty frames so the consumer keeps the cadence.
+                binary_out.write(_boxes_to_msgpack(boxes or (), timestamp))
+                binary_out.flush()
+            elif boxes is None:
+                print(f"[{_format_timestamp(timestamp)}] No answer (Timeout)")
+            elif as_json:
+                print(_boxes_to_json(boxes, timestamp))
+            else:
+                _print_boxes_human_readable(boxes, timestamp)
+        except Exception as exc:
+            logger.error("Could not write results, stopping output: %s", exc)
+            return
+
+
+def _queue_result(
+    results: "queue.Queue[Optional[Tuple[float, Optional[Sequence[FaceDetectionBox]]]]]",
+    item: Optional[Tuple[float, Optional[Sequence[FaceDetectionBox]]]],
+    printer: threading.Thread,
+    pacer: "_Pacer",
+) -> bool:
+    """Hand ``item`` to the printer; False once the printer is gone or a stop was requested."""
+
+    while printer.is_alive():
+        try:
+            results.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            if pacer.stopped:
+                return False
+    return False
+
+
+class _Pacer:
+    """Waits for the start of each period of a fixed-rate loop.
+
+    On Linux with Python 3.13+ the periods come from a kernel ``timerfd``
+    waited on through a selector together with a wake pipe, so wakeups are
+    precise and a shutdown request interrupts the wait immediately; missed
+    expirations are coalesced by the kernel. Elsewhere it sleeps until an
+    absolute monotonic deadline.
+    """
+
+    def __init__(self, period: float) -> None:
+        self._period = period
+        self._next_deadline = time.monotonic()
+        self.stopped = False
+        self._timer_fd: Optional[int] = None
+        self._wake_fds: Optional[Tuple[int, int]] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        if hasattr(os, "timerfd_create"):
+            try:
+                self._open_timer()
+            except OSError as exc:
+                logger.debug("timerfd unavailable, pacing with sleep: %s", exc)
+                self.close()
+
+    def _open_timer(self) -> None:
+        self._timer_fd = os.timerfd_create(time.CLOCK_MONOTONIC, flags=os.TFD_NONBLOCK | os.TFD_CLOEXEC)
+        os.timerfd_settime(self._timer_fd, initial=self._period, interval=self._period)
+        self._wake_fds = os.pipe()
+        os.set_blocking(self._wake_fds[1], False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._timer_fd, selectors.EVENT_READ)
+        self._selector.register(self._wake_fds[0], selectors.EVENT_READ)
+
+    def wake(self) -> None:
+        """Request shutdown; safe to call from a signal handler."""
+
+        self.stopped = True
+        if self._wake_fds is not None:
+            try:
+                os.write(self._wake_fds[1], b"\0")
+            except OSError:
+                pass
+
+    def wait(self) -> bool:
+        """Block until the next period starts; ``False`` once shutdown was requested."""
+
+        if self._selector is None:
+            self._next_deadline += self._period
+            now = time.monotonic()
+            if now - self._next_deadline > _MAX_LAG_PERIODS * self._period:
+                # Too far behind (e.g. a stalled read); resync instead of bursting.
+                self._next_deadline = now
+            time.sleep(max(0.0, self._next_deadline - now))
+            return not self.stopped
+
+        while not self.stopped:
+            ready = {key.fd for key, _ in self._selector.select()}
+            if self._timer_fd in ready and not self.stopped:
+                try:
+                    # Expiration counter; reading it also drops missed periods.
+                    os.read(self._timer_fd, 8)
+                except BlockingIOError:
+                    continue
+                return True
+        return False
+
+    def close(self) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        for fd in (self._timer_fd, *(self._wake_fds or ())):
+            if fd is not None:
+                os.close(fd)
+        self._timer_fd = None
+        self._wake_fds = None
 
 
 def _run_loop(args: argparse.Namespace) -> int:
     if args.hz <= 0:
         logger.error("--hz must be greater than 0 (recent %.2f)", args.hz)
         return 2
+    if args.msgpack and msgpack is None:
+        logger.error("--msgpack requires the msgpack package (pip install msgpack)")
+        return 2
 
+    output = "msgpack" if args.msgpack else ("json" if args.json else "text")
     period = 1.0 / args.hz
     logger.info(
         "Starting Grove Vision AI standalone test: port=%s baud=%d hz=%.2f timeout=%.2f",
@@ -132,39 +340,51 @@ def _run_loop(args: argparse.Namespace) -> int:
     except Exception as exc:
         logger.error("Could not open Grove Vision AI board: %s", exc)
         return 1
+    if args.low_latency:
+        if client.set_low_latency(True):
+            logger.info("Low-latency mode enabled on %s", args.serial_port)
+        else:
+            logger.warning("Low-latency mode not supported on %s", args.serial_port)
 
-    stop_requested = False
+    pacer = _Pacer(period)
 
     def _handle_signal(signum: int, _frame: object) -> None:
-        nonlocal stop_requested
         logger.info("Signal %s received, quit.", signum)
-        stop_requested = True
+        pacer.wake()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         signal.signal(sig, _handle_signal)
 
+    # Results are printed on a separate thread so formatting and stdout never
+    # delay the next invoke; the small bound keeps output close to real time.
+    results: "queue.Queue[Optional[Tuple[float, Optional[Sequence[FaceDetectionBox]]]]]" = queue.Queue(maxsize=2)
+    printer = threading.Thread(target=_print_results, args=(results, output), name="VisionPrinter", daemon=True)
+    printer.start()
+
     iteration = 0
+    # _Pacer keeps an absolute schedule, so variable invoke latency does not
+    # accumulate into rate drift.
     try:
-        while not stop_requested:
+        while not pacer.stopped:
             iteration += 1
-            loop_start = time.monotonic()
             boxes = client.invoke_once(timeout=args.timeout)
-            if boxes is None:
-                print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] No answer (Timeout)")
-            else:
-                if args.json:
-                    print(_boxes_to_json(boxes))
-                else:
-                    _print_boxes_human_readable(boxes)
+            if not _queue_result(results, (time.time(), boxes), printer, pacer):
+                break
             if args.max_iterations and iteration >= args.max_iterations:
                 logger.info("Maximum number of iterations (%d) reached", args.max_iterations)
                 break
-            elapsed = time.monotonic() - loop_start
-            sleep_time = max(0.0, period - elapsed)
-            time.sleep(sleep_time)
+            if not pacer.wait():
+                break
     except KeyboardInterrupt:
         logger.info("Got KeyboardInterrupt, quit.")
     finally:
+        if printer.is_alive():
+            try:
+                results.put(None, timeout=1.0)
+            except queue.Full:
+                pass
+            printer.join(timeout=1.0)
+        pacer.close()
         client.close()
         logger.info("Serial connection closed")
     return 0
@@ -12,16 +12,29 @@ CPython. Core functionality:
 The class is intentionally generic so it can be used in tests with simulated
 channels. Only a ``duty_cycle`` attribute (0..65535) is required on the provided
 channel.
+
+``PCA9685Bus`` optionally sits between the servos and the PCA9685 so that all
+duty-cycle changes of one control tick can be flushed in a single auto-increment
+block write instead of one I²C transaction per channel. ``flush_servos`` steps a
+group of servos inside such a batch.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-import math
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+import struct
 import threading
-from typing import Protocol
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+
+__all__ = ["Servo", "ServoConfig", "PCA9685ChannelProtocol", "PCA9685Bus", "flush_servos"]
 
-__all__ = ["Servo", "ServoConfig", "PCA9685ChannelProtocol"]
+# First LEDn register of the PCA9685; each channel occupies 4 bytes
+# (ON_L, ON_H, OFF_L, OFF_H) and MODE1.AI lets one write span many channels.
+_LED0_ON_L = 0x06
+# Register address byte followed by (ON, OFF) pairs for n consecutive channels,
+# precompiled for every run length so a block is packed in a single call.
+_PWM_BLOCK_STRUCTS = tuple(struct.Struct(f"<B{2 * n}H") for n in range(17))
 
 
 class PCA9685ChannelProtocol(Protocol):
@@ -49,6 +62,11 @@ class ServoConfig:
     invert: bool = False
     pwm_frequency_hz: float = 50.0
 
+    # Derived conversion constants, filled in by ``__post_init__``.
+    _inv_span_angle: float = field(init=False, repr=False, compare=False)
+    _pulse_span: float = field(init=False, repr=False, compare=False)
+    _duty_scale: float = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         if self.min_angle_deg >= self.max_angle_deg:
             raise ValueError("min_angle_deg muss kleiner als max_angle_deg sein")
@@ -62,44 +80,79 @@ class ServoConfig:
             raise ValueError("deadzone_deg darf nicht negativ sein")
         if self.pwm_frequency_hz <= 0.0:
             raise ValueError("pwm_frequency_hz muss positiv sein")
+        period_us = 1_000_000.0 / self.pwm_frequency_hz
+        object.__setattr__(self, "_inv_span_angle", 1.0 / (self.max_angle_deg - self.min_angle_deg))
+        object.__setattr__(self, "_pulse_span", self.max_pulse_us - self.min_pulse_us)
+        object.__setattr__(self, "_duty_scale", 0xFFFF / period_us)
 
 
 class Servo:
     """Control a single servo channel via the PCA9685."""
 
+    __slots__ = (
+        "_lock",
+        "_channel",
+        "config",
+        "_target_deg",
+        "_angle_deg",
+        "_velocity_deg_per_s",
+        "_last_duty",
+        "_max_speed",
+        "_max_accel",
+        "_deadzone",
+        "_min_a",
+        "_max_a",
+        "_min_pulse",
+        "_pulse_span",
+        "_inv_span",
+        "_duty_scale",
+        "_invert",
+    )
+
     def __init__(self, channel: PCA9685ChannelProtocol, *, config: ServoConfig | None = None) -> None:
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._channel = channel
         self.config = config or ServoConfig()
+        # Plain copies of the (frozen) config scalars used on every tick.
+        cfg = self.config
+        self._max_speed = cfg.max_speed_deg_per_s
+        self._max_accel = cfg.max_accel_deg_per_s2
+        self._deadzone = cfg.deadzone_deg
+        self._min_a = cfg.min_angle_deg
+        self._max_a = cfg.max_angle_deg
+        self._min_pulse = cfg.min_pulse_us
+        self._pulse_span = cfg._pulse_span
+        self._inv_span = cfg._inv_span_angle
+        self._duty_scale = cfg._duty_scale
+        self._invert = cfg.invert
 
         neutral = self._clamp_angle(self.config.neutral_deg)
         self._target_deg = neutral
         self._angle_deg = neutral
         self._velocity_deg_per_s = 0.0
-        self._last_pulse = self._angle_to_pulse(self._angle_deg)
-        self._write_pwm(self._last_pulse)
+        self._last_duty = self._pulse_to_duty(self._angle_to_pulse(self._angle_deg))
+        self._channel.duty_cycle = self._last_duty
 
 
+    # The getters read a single attribute, which is atomic under the GIL, so
+    # they skip the lock; it only guards the multi-field updates below.
     @property
     def angle_deg(self) -> float:
         """Current servo angle in degrees."""
 
-        with self._lock:
-            return self._angle_deg
+        return self._angle_deg
 
     @property
     def target_deg(self) -> float:
         """Target angle set via ``move_to``."""
 
-        with self._lock:
-            return self._target_deg
+        return self._target_deg
 
     @property
     def velocity_deg_per_s(self) -> float:
         """Current angular velocity."""
 
-        with self._lock:
-            return self._velocity_deg_per_s
+        return self._velocity_deg_per_s
 
     def move_to(self, angle_deg: float) -> None:
         """Set a new target angle.
@@ -115,7 +168,7 @@ class Servo:
         """Shift the target angle relative to the current value."""
 
         with self._lock:
-            self.move_to(self._target_deg + delta_deg)
+            self._target_deg = self._clamp_angle(self._target_deg + delta_deg)
 
     def reset(self) -> None:
         """Reset servo and target to the neutral angle."""
@@ -135,67 +188,298 @@ class Servo:
         with self._lock:
             target = self._target_deg
             angle_error = target - self._angle_deg
-            if abs(angle_error) <= self.config.deadzone_deg:
+            if abs(angle_error) <= self._deadzone:
                 self._velocity_deg_per_s = 0.0
 
                 return
 
-            desired_velocity = angle_error / dt
-            desired_velocity = _clamp(
-                desired_velocity,
-                -self.config.max_speed_deg_per_s,
-                self.config.max_speed_deg_per_s,
-            )
-
-            delta_v = desired_velocity - self._velocity_deg_per_s
-            max_delta_v = self.config.max_accel_deg_per_s2 * dt
-            delta_v = _clamp(delta_v, -max_delta_v, max_delta_v)
-            new_velocity = self._velocity_deg_per_s + delta_v
-            new_velocity = _clamp(
-                new_velocity,
-                -self.config.max_speed_deg_per_s,
-                self.config.max_speed_deg_per_s,
+            new_angle, new_velocity = _servo_step(
+                self._angle_deg,
+                target,
+                self._velocity_deg_per_s,
+                dt,
+                self._max_speed,
+                self._max_accel,
+                self._min_a,
+                self._max_a,
             )
-
-            new_angle = self._angle_deg + new_velocity * dt
-
-            if math.copysign(1.0, angle_error) != math.copysign(1.0, target - new_angle):
-                new_angle = target
-                new_velocity = 0.0
-
-            self._angle_deg = self._clamp_angle(new_angle)
+            self._angle_deg = new_angle
             self._velocity_deg_per_s = new_velocity
             self._apply_output()
 
 
     def _apply_output(self) -> None:
-        pulse = self._angle_to_pulse(self._angle_deg)
-        if pulse != self._last_pulse:
-            self._write_pwm(pulse)
-            self._last_pulse = pulse
+        # Compare the integer duty: sub-microsecond pulse changes round to the
+        # same register value and would only cause a redundant write.
+        duty = self._pulse_to_duty(self._angle_to_pulse(self._angle_deg))
+        if duty != self._last_duty:
+            self._channel.duty_cycle = duty
+            self._last_duty = duty
 
-    def _write_pwm(self, pulse_us: float) -> None:
-        period_us = 1_000_000.0 / self.config.pwm_frequency_hz
-        duty_cycle = int(round(_clamp(pulse_us / period_us, 0.0, 1.0) * 0xFFFF))
-        self._channel.duty_cycle = duty_cycle
+    def _pulse_to_duty(self, pulse_us: float) -> int:
+        duty = pulse_us * self._duty_scale
+        return 0 if duty <= 0.0 else (0xFFFF if duty >= 65535.0 else int(duty + 0.5))
 
     def _angle_to_pulse(self, angle_deg: float) -> float:
-        if self.config.invert:
+        if self._invert:
             angle_deg = self._invert_angle(angle_deg)
-        span_angle = self.config.max_angle_deg - self.config.min_angle_deg
-        normalized = (angle_deg - self.config.min_angle_deg) / span_angle
-        normalized = _clamp(normalized, 0.0, 1.0)
-        pulse_span = self.config.max_pulse_us - self.config.min_pulse_us
-        return self.config.min_pulse_us + normalized * pulse_span
+        normalized = (angle_deg - self._min_a) * self._inv_span
+        normalized = 0.0 if normalized < 0.0 else (1.0 if normalized > 1.0 else normalized)
+        return self._min_pulse + normalized * self._pulse_span
 
     def _clamp_angle(self, angle_deg: float) -> float:
-        return _clamp(angle_deg, self.config.min_angle_deg, self.config.max_angle_deg)
+        return self._min_a if angle_deg < self._min_a else (self._max_a if angle_deg > self._max_a else angle_deg)
 
     def _invert_angle(self, angle_deg: float) -> float:
-        min_a = self.config.min_angle_deg
-        max_a = self.config.max_angle_deg
-        return max_a - (angle_deg - min_a)
+        return self._max_a - (angle_deg - self._min_a)
+
+
+class _BatchedChannel:
+    """Channel proxy handed to ``Servo`` by ``PCA9685Bus.channel``."""
+
+    def __init__(self, bus: "PCA9685Bus", index: int) -> None:
+        self._bus = bus
+        self._index = index
+
+    @property
+    def duty_cycle(self) -> int:
+        return self._bus._read_duty(self._index)
+
+    @duty_cycle.setter
+    def duty_cycle(self, value: int) -> None:
+        self._bus._write_duty(self._index, value)
+
 
+class PCA9685Bus:
+    """Shared front-end for a PCA9685 that can batch channel writes.
+
+    Outside of a batch every ``duty_cycle`` assignment is written through to the
+    underlying channel as before. Between ``begin_batch()`` and
+    ``commit_batch()`` the calling thread only updates an in-memory register
+    shadow; the commit then writes all dirty channels (and the known channels
+    between them) with one auto-increment block transfer. Batches are
+    per-thread, so other threads driving servos on the same board keep their
+    immediate write-through behaviour.
+    """
+
+    def __init__(self, pca: Any) -> None:
+        self._pca = pca
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Values the chip is known to hold; batched values not yet written live
+        # per thread in ``self._local.dirty``.
+        self._duties: Dict[int, int] = {}
+
+    def channel(self, index: int) -> PCA9685ChannelProtocol:
+        """Return a channel object for ``Servo`` that routes through this bus."""
+
+        if not 0 <= index < 16:
+            raise ValueError(f"PCA9685-Kanal {index} liegt außerhalb von 0..15")
+        return _BatchedChannel(self, index)
+
+    def begin_batch(self) -> None:
+        """Start collecting writes of the calling thread (nestable)."""
+
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+
+    def commit_batch(self) -> None:
+        """Finish the current batch and flush pending writes in one transfer."""
+
+        depth = getattr(self._local, "depth", 0) - 1
+        self._local.depth = max(0, depth)
+        if depth > 0:
+            return
+        with self._lock:
+            pending = self._dirty()
+            if not pending:
+                return
+            dirty = self._local.dirty = {}
+            runs = self._dirty_runs(sorted(pending))
+            for number, (start, end) in enumerate(runs):
+                try:
+                    self._write_block(start, end, pending)
+                except Exception:
+                    # The failed run's registers are now unknown: queue all of its
+                    # channels again, together with the runs not attempted yet.
+                    for index in range(start, end + 1):
+                        known = self._duties.pop(index, None)
+                        dirty[index] = pending.get(index, known)
+                    for later_start, later_end in runs[number + 1:]:
+                        for index in range(later_start, later_end + 1):
+                            if index in pending:
+                                dirty[index] = pending[index]
+                    raise
+                for index in range(start, end + 1):
+                    if index in pending:
+                        self._duties[index] = pending[index]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager wrapping ``begin_batch``/``commit_batch``."""
+
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.commit_batch()
+
+    def _batching(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    def _dirty(self) -> Dict[int, int]:
+        """Batched values of the calling thread that are not written yet."""
+
+        dirty = getattr(self._local, "dirty", None)
+        if dirty is None:
+            dirty = self._local.dirty = {}
+        return dirty
+
+    def _read_duty(self, index: int) -> int:
+        with self._lock:
+            duty = self._dirty().get(index, self._duties.get(index))
+        if duty is None:
+            return self._pca.channels[index].duty_cycle
+        return duty
+
+    def _write_duty(self, index: int, value: int) -> None:
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f"duty_cycle {value} liegt außerhalb von 0..65535")
+        with self._lock:
+            dirty = self._dirty()
+            # Skip values the chip already has (or that this thread already
+            # queued): different pulse widths often round to the same 16-bit duty.
+            if dirty.get(index, self._duties.get(index)) == value:
+                return
+            if self._batching():
+                dirty[index] = value
+                return
+            # Record the value only once the chip has it, so a failed write is
+            # retried instead of being deduplicated away.
+            self._pca.channels[index].duty_cycle = value
+            self._duties[index] = value
+            dirty.pop(index, None)
+
+    def _dirty_runs(self, dirty: List[int]) -> List[Tuple[int, int]]:
+        """Group dirty channels into contiguous runs of known channels."""
+
+        runs: List[Tuple[int, int]] = []
+        start = prev = dirty[0]
+        for index in dirty[1:]:
+            if all(gap in self._duties for gap in range(prev + 1, index)):
+                prev = index
+                continue
+            runs.append((start, prev))
+            start = prev = index
+        runs.append((start, prev))
+        return runs
+
+    def _write_block(self, start: int, end: int, pending: Dict[int, int]) -> None:
+        device = getattr(self._pca, "i2c_device", None)
+        if device is None:
+            for index in range(start, end + 1):
+                self._pca.channels[index].duty_cycle = pending.get(index, self._duties.get(index))
+            return
+        values = [_LED0_ON_L + 4 * start]
+        for index in range(start, end + 1):
+            values.extend(_duty_to_registers(pending.get(index, self._duties.get(index))))
+        payload = _PWM_BLOCK_STRUCTS[end - start + 1].pack(*values)
+        with device as i2c:
+            i2c.write(payload)
+
+
+def flush_servos(
+    servos: Iterable[Servo],
+    dt: float,
+    on_error: Optional[Callable[[Servo, Exception], None]] = None,
+) -> None:
+    """Advance ``servos`` by ``dt`` and write their outputs together.
+
+    ``move_to`` only changes the target, so this is where the I²C traffic of a
+    control tick happens. Servos attached through a ``PCA9685Bus`` are updated
+    inside one batch per bus, i.e. a single block write instead of one
+    transaction per channel; other channels are written directly.
+
+    With ``on_error`` an exception from one servo's update is passed to the
+    callback and the remaining servos are still updated.
+    """
+
+    servos = tuple(servos)
+    buses: Dict[int, PCA9685Bus] = {}
+    for servo in servos:
+        channel = servo._channel
+        if isinstance(channel, _BatchedChannel):
+            buses[id(channel._bus)] = channel._bus
+    with ExitStack() as stack:
+        for bus in buses.values():
+            stack.enter_context(bus.batch())
+        for servo in servos:
+            if on_error is None:
+                servo.update(dt)
+                continue
+            try:
+                servo.update(dt)
+            except Exception as exc:
+                on_error(servo, exc)
+
+
+def _servo_step(
+    angle: float,
+    target: float,
+    velocity: float,
+    dt: float,
+    max_speed: float,
+    max_accel: float,
+    min_angle: float,
+    max_angle: float,
+) -> Tuple[float, float]:
+    """One speed/acceleration-limited integration step; returns ``(angle, velocity)``.
+
+    Clamps are inlined since this runs for every servo on every tick.
+    """
+
+    angle_error = target - angle
+    desired_velocity = angle_error / dt
+    if desired_velocity > max_speed:
+        desired_velocity = max_speed
+    elif desired_velocity < -max_speed:
+        desired_velocity = -max_speed
+
+    delta_v = desired_velocity - velocity
+    max_delta_v = max_accel * dt
+    if delta_v > max_delta_v:
+        delta_v = max_delta_v
+    elif delta_v < -max_delta_v:
+        delta_v = -max_delta_v
+    new_velocity = velocity + delta_v
+    if new_velocity > max_speed:
+        new_velocity = max_speed
+    elif new_velocity < -max_speed:
+        new_velocity = -max_speed
+
+    new_angle = angle + new_velocity * dt
+
+    # Overshoot (or exact arrival) when the remaining error no longer has the
+    # sign of the initial one.
+    if angle_error * (target - new_angle) <= 0.0:
+        new_angle = target
+        new_velocity = 0.0
+
+    if new_angle > max_angle:
+        new_angle = max_angle
+    elif new_angle < min_angle:
+        new_angle = min_angle
+    return new_angle, new_velocity
+
+
+def _duty_to_registers(duty: int) -> Tuple[int, int]:
+    """Translate a 16-bit duty cycle into PCA9685 (ON, OFF) register values.
+
+    Mirrors ``adafruit_pca9685.PWMChannel.duty_cycle`` so block writes produce
+    exactly what per-channel writes would.
+    """
 
-def _clamp(value: float, lower: float, upper: float) -> float:
-    return max(lower, min(upper, value))
+    if duty == 0xFFFF:
+        return 0x1000, 0
+    if duty < 0x0010:
+        return 0, 0x1000
+    return 0, duty >> 4
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
 import json
+import math
 import sys
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Mapping, Protocol, Sequence
+from typing import Any, Callable, Iterable, List, Mapping, Protocol, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both parsers accept bytes, and orjson's JSONDecodeError subclasses json's.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Angles closer than this are treated as the same position.
+_ANGLE_EPSILON_DEG = 1e-6
 
 
 SERVO_LABELS = {
@@ -48,10 +63,14 @@ class ServoCalibrationEntry:
     stop_set: bool = False
 
     def clamp(self, angle: float) -> float:
-        return clamp(angle, self.min_deg, self.max_deg)
+        lower = self.min_deg
+        upper = self.max_deg
+        return lower if angle < lower else (upper if angle > upper else angle)
 
     def clamp_stop(self, angle: float) -> float:
-        return clamp(angle, self.min_deg, self.max_deg)
+        lower = self.min_deg
+        upper = self.max_deg
+        return lower if angle < lower else (upper if angle > upper else angle)
 
 
 class ServoCalibrationSession:
@@ -95,19 +114,7 @@ class ServoCalibrationSession:
             for channel in channels
         ]
         self._apply_initial_calibration(initial_calibration or {})
-        self._factory_values = {
-            entry.channel: (
-                entry.min_deg,
-                entry.max_deg,
-                entry.start_deg,
-                entry.stop_deg,
-                entry.min_set,
-                entry.max_set,
-                entry.start_set,
-                entry.stop_set,
-            )
-            for entry in self.entries
-        }
+        self._factory_snapshots = {entry.channel: copy.copy(entry) for entry in self.entries}
         self._current_index = 0
         self._current_angle = self.entries[0].start_deg
         self._last_applied_angle: float | None = None
@@ -124,56 +131,95 @@ class ServoCalibrationSession:
     def process_command(self, command: str) -> bool:
         """Process a single key press."""
 
-        if not command:
-            return True
         if command == "Q":
             return False
+        handler = self._COMMANDS.get(command)
+        if handler is not None:
+            handler(self)
+        return True
+
+    def _cmd_goto_min(self) -> None:
+        self._set_current_angle(self.current_entry.min_deg)
+
+    def _cmd_goto_max(self) -> None:
+        self._set_current_angle(self.current_entry.max_deg)
+
+    def _cmd_goto_start(self) -> None:
+        self._set_current_angle(self.current_entry.start_deg)
 
+    def _cmd_step_up(self) -> None:
+        self._step(self.step_deg)
+
+    def _cmd_step_down(self) -> None:
+        self._step(-self.step_deg)
+
+    def _step(self, delta: float) -> None:
         entry = self.current_entry
-        if command == "<":
-            self._set_current_angle(entry.min_deg)
-        elif command == ">":
-            self._set_current_angle(entry.max_deg)
-        elif command == "c":
-            self._set_current_angle(entry.start_deg)
-        elif command == "u":
-            self._set_current_angle(entry.clamp(self._current_angle + self.step_deg))
-        elif command == "d":
-            self._set_current_angle(entry.clamp(self._current_angle - self.step_deg))
-        elif command == "U":
-            entry.max_deg = self._current_angle
-            entry.max_set = True
-            if entry.min_deg > entry.max_deg:
-                entry.min_deg = entry.max_deg
-            entry.start_deg = entry.clamp(entry.start_deg)
-            entry.stop_deg = entry.clamp_stop(entry.stop_deg)
-        elif command == "D":
-            entry.min_deg = self._current_angle
-            entry.min_set = True
-            if entry.max_deg < entry.min_deg:
-                entry.max_deg = entry.min_deg
-            entry.start_deg = entry.clamp(entry.start_deg)
-            entry.stop_deg = entry.clamp_stop(entry.stop_deg)
-        elif command == "A":
-            entry.start_deg = entry.clamp(self._current_angle)
-            entry.start_set = True
-        elif command == "Z":
-            entry.stop_deg = entry.clamp_stop(self._current_angle)
-            entry.stop_set = True
-        elif command == "x":
-            self._reset_current_entry()
-        elif command == "n":
-            return self._advance_to_next_servo()
-        elif command == "p":
-            return self._move_to_previous_servo()
-        elif command == "+":
-            self.step_deg = min(10.0, self.step_deg + 1.0)
-        elif command == "-":
-            self.step_deg = max(1.0, min(10.0, self.step_deg - 1.0))
-        else:
-            return True
+        lower = entry.min_deg
+        upper = entry.max_deg
+        angle = self._current_angle + delta
+        self._set_current_angle(lower if angle < lower else (upper if angle > upper else angle))
 
-        return True
+    def _cmd_store_max(self) -> None:
+        entry = self.current_entry
+        entry.max_deg = self._current_angle
+        entry.max_set = True
+        if entry.min_deg > entry.max_deg:
+            entry.min_deg = entry.max_deg
+        entry.start_deg = entry.clamp(entry.start_deg)
+        entry.stop_deg = entry.clamp_stop(entry.stop_deg)
+
+    def _cmd_store_min(self) -> None:
+        entry = self.current_entry
+        entry.min_deg = self._current_angle
+        entry.min_set = True
+        if entry.max_deg < entry.min_deg:
+            entry.max_deg = entry.min_deg
+        entry.start_deg = entry.clamp(entry.start_deg)
+        entry.stop_deg = entry.clamp_stop(entry.stop_deg)
+
+    def _cmd_store_start(self) -> None:
+        entry = self.current_entry
+        entry.start_deg = entry.clamp(self._current_angle)
+        entry.start_set = True
+
+    def _cmd_store_stop(self) -> None:
+        entry = self.current_entry
+        entry.stop_deg = entry.clamp_stop(self._current_angle)
+        entry.stop_set = True
+
+    def _cmd_step_larger(self) -> None:
+        self.step_deg = min(10.0, self.step_deg + 1.0)
+
+    def _cmd_step_smaller(self) -> None:
+        self.step_deg = max(1.0, min(10.0, self.step_deg - 1.0))
+
+    def _cmd_reset(self) -> None:
+        self._reset_current_entry()
+
+    def _cmd_next(self) -> None:
+        self._advance_to_next_servo()
+
+    def _cmd_previous(self) -> None:
+        self._move_to_previous_servo()
+
+    # Key -> handler; unknown keys are ignored.
+    _COMMANDS: dict[str, Callable[["ServoCalibrationSession"], None]] = {
+        "<": _cmd_goto_min,
+        ">": _cmd_goto_max,
+        "c": _cmd_goto_start,
+        "u": _cmd_step_up,
+        "d": _cmd_step_down,
+        "U": _cmd_store_max,
+        "D": _cmd_store_min,
+        "A": _cmd_store_start,
+        "Z": _cmd_store_stop,
+        "x": _cmd_reset,
+        "n": _cmd_next,
+        "p": _cmd_previous,
+        "+": _cmd_step_larger,
+        "-": _cmd_step_smaller,
+    }
 
     def _advance_to_next_servo(self) -> bool:
         self._current_index = (self._current_index + 1) % len(self.entries)
@@ -188,30 +234,8 @@ class ServoCalibrationSession:
         return True
 
     def _reset_current_entry(self) -> None:
-        entry = self.current_entry
-        defaults = self._factory_values.get(
-            entry.channel,
-            (
-                self._default_min_deg,
-                self._default_max_deg,
-                self._default_start_deg,
-                self._default_stop_deg,
-                False,
-                False,
-                False,
-                False,
-            ),
-        )
-        (
-            entry.min_deg,
-            entry.max_deg,
-            entry.start_deg,
-            entry.stop_deg,
-            entry.min_set,
-            entry.max_set,
-            entry.start_set,
-            entry.stop_set,
-        ) = defaults
+        entry = copy.copy(self._factory_snapshots[self.current_entry.channel])
+        self.entries[self._current_index] = entry
         self._set_current_angle(entry.start_deg)
 
     def _apply_initial_calibration(self, calibration: Mapping[int, Mapping[str, float]]) -> None:
@@ -242,7 +266,9 @@ class ServoCalibrationSession:
                 entry.stop_deg = clamp(entry.stop_deg, entry.min_deg, entry.max_deg)
 
     def _set_current_angle(self, angle: float) -> None:
-        if angle == self._current_angle:
+        # Sub-epsilon differences (e.g. from clamping at a limit) are the same
+        # position; the driver additionally drops writes with an unchanged duty.
+        if abs(angle - self._current_angle) < _ANGLE_EPSILON_DEG:
             return
         self._current_angle = angle
         self._apply_angle()
@@ -289,7 +315,24 @@ class PCA9685AngleDriver:
         self._min_angle_deg = min_angle_deg
         self._max_angle_deg = max_angle_deg
         self._angle_span = max_angle_deg - min_angle_deg
+        # Angle -> duty is affine, so set_angle needs one clamp and one multiply-add.
+        self._duty_per_deg = (max_pulse_us - min_pulse_us) / self._angle_span / self._period_us * 0xFFFF
+        self._duty_offset = min_pulse_us / self._period_us * 0xFFFF - min_angle_deg * self._duty_per_deg
+        # Pulses longer than the PWM period would overflow the duty register.
+        self._upper_angle_deg = max_angle_deg
+        if max_pulse_us > self._period_us:
+            self._upper_angle_deg = (0xFFFF - self._duty_offset) / self._duty_per_deg
+        # The session steps in whole degrees, so integer angles are served from a table.
+        self._lut_first_deg = math.ceil(min_angle_deg)
+        self._lut_last_deg = math.floor(max_angle_deg)
+        self._duty_lut = array(
+            "H", (self._angle_to_duty(angle) for angle in range(self._lut_first_deg, self._lut_last_deg + 1))
+        )
         self._pca = self._create_controller(i2c_address, pwm_frequency_hz)
+        # adafruit_pca9685 builds a new PWMChannel wrapper on every channels[i] lookup.
+        self._channel_cache: dict[int, Any] = {}
+        # Neighbouring angles can map to the same duty; skip those I²C writes.
+        self._last_duty: dict[int, int] = {}
 
     def _create_controller(self, address: int, freq: float):
         try:
@@ -309,13 +352,25 @@ class PCA9685AngleDriver:
         controller.frequency = int(freq)
         return controller
 
+    def _angle_to_duty(self, angle_deg: float) -> int:
+        lower = self._min_angle_deg
+        upper = self._upper_angle_deg
+        angle_deg = lower if angle_deg < lower else (upper if angle_deg > upper else angle_deg)
+        return int(self._duty_offset + angle_deg * self._duty_per_deg + 0.5)
+
     def set_angle(self, channel: int, angle_deg: float) -> None:
-        angle_deg = clamp(angle_deg, self._min_angle_deg, self._max_angle_deg)
-        normalized = (angle_deg - self._min_angle_deg) / self._angle_span
-        pulse_span = self._max_pulse_us - self._min_pulse_us
-        pulse = self._min_pulse_us + clamp(normalized, 0.0, 1.0) * pulse_span
-        duty_cycle = int(round(clamp(pulse / self._period_us, 0.0, 1.0) * 0xFFFF))
-        self._pca.channels[channel].duty_cycle = duty_cycle
+        whole_deg = int(angle_deg)
+        if whole_deg == angle_deg and self._lut_first_deg <= whole_deg <= self._lut_last_deg:
+            duty_cycle = self._duty_lut[whole_deg - self._lut_first_deg]
+        else:
+            duty_cycle = self._angle_to_duty(angle_deg)
+        if self._last_duty.get(channel) == duty_cycle:
+            return
+        pwm_channel = self._channel_cache.get(channel)
+        if pwm_channel is None:
+            pwm_channel = self._channel_cache[channel] = self._pca.channels[channel]
+        pwm_channel.duty_cycle = duty_cycle
+        self._last_duty[channel] = duty_cycle
 
     def close(self) -> None:
         if hasattr(self._pca, "deinit"):
@@ -346,11 +401,7 @@ def parse_channels(expr: str) -> List[int]:
             channels.extend(range(start, end + step, step))
         else:
             channels.append(int(part, 0))
-    unique = []
-    for channel in channels:
-        if channel not in unique:
-            unique.append(channel)
-    return unique
+    return list(dict.fromkeys(channels))
 
 
 def export_calibration(entries: Iterable[ServoCalibrationEntry], destination: Path) -> None:
@@ -374,7 +425,7 @@ def load_calibration(source: Path) -> Mapping[int, Mapping[str, float]]:
     if not source.exists():
         return {}
     try:
-        payload = json.loads(source.read_text(encoding="utf-8"))
+        payload = _json_loads(source.read_bytes())
     except (OSError, json.JSONDecodeError) as exc:
         print(f"Warnung: Calibration from {source} could not be read: {exc}", file=sys.stderr)
         return {}
@@ -403,35 +454,62 @@ def load_calibration(source: Path) -> Mapping[int, Mapping[str, float]]:
 
 
 class KeyReader:
-    """Read individual key presses from the terminal."""
+    """Read individual key presses from the terminal.
+
+    Used as a context manager, the terminal is switched to raw mode once for
+    the whole session instead of around every key press.
+    """
 
     def __init__(self) -> None:
         self._stdin = sys.stdin
+        self._termios: Any = None
+        self._fd: int | None = None
+        self._old_settings: list | None = None
 
-    def read_key(self) -> str:
+    def __enter__(self) -> "KeyReader":
         if not self._stdin.isatty():
-            value = input("Enter command and press Enter: ")
-            return value[:1] if value else ""
+            return self
         try:
             import termios
             import tty
         except ImportError:
+            return self
+        fd = self._stdin.fileno()
+        self._old_settings = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        # Keep output post-processing so printed newlines still return the cursor.
+        attributes = termios.tcgetattr(fd)
+        attributes[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, attributes)
+        self._termios = termios
+        self._fd = fd
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._old_settings is not None:
+            self._termios.tcsetattr(self._fd, self._termios.TCSADRAIN, self._old_settings)
+            self._old_settings = None
+
+    def read_key(self) -> str:
+        if self._old_settings is None:
             value = input("Enter command and press Enter: ")
             return value[:1] if value else ""
-        fd = self._stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            char = self._stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        char = self._stdin.read(1)
         if char == "\x03":
             raise KeyboardInterrupt
         return char
 
 
+@functools.lru_cache(maxsize=256)
 def format_value(value: float, is_set: bool) -> str:
-    """Format stored calibration values with emphasis."""
+    """Format stored calibration values with emphasis.
+
+    Cached on ``(value, is_set)``: the stored values only change on save
+    commands, so redraws reuse the rendered strings.
+    """
 
     if not is_set:
         return "-"
@@ -439,7 +517,6 @@ def format_value(value: float, is_set: bool) -> str:
 
 
 def run_interactive(session: ServoCalibrationSession) -> None:
-    key_reader = KeyReader()
     header = (
         "\033[1mSteuerung:\033[0m "
         "\033[33m<\033[0m (zu Min-Winkel), \033[33m>\033[0m (zu Max-Winkel), "
@@ -452,49 +529,65 @@ def run_interactive(session: ServoCalibrationSession) -> None:
     )
     print(header)
 
+    status_template = (
+        "\033[36mCurrent\033[0m: {:.1f}° | "
+        "\033[36mStep\033[0m: {:.1f}° | "
+        "\033[36mMin\033[0m: {} | "
+        "\033[36mMax\033[0m: {} | "
+        "\033[36mStart\033[0m: {} | "
+        "\033[36mStop\033[0m: {}"
+    )
     last_channel: int | None = None
+    last_status_key: tuple | None = None
     status_line_active = False
 
-    while True:
-        entry = session.current_entry
-
-        if entry.channel != last_channel:
-            if status_line_active:
-                print()
-                status_line_active = False
-            channel_label = session.channel_label(entry.channel)
-            channel_display = f"Kanal {entry.channel}"
-            if channel_label:
-                channel_display += f" (\033[92m{channel_label}\033[0m)"
-            print(f"\n\033[1m=== Servo-{channel_display} ===\033[0m")
-            last_channel = entry.channel
-
-        min_display = format_value(entry.min_deg, entry.min_set)
-        max_display = format_value(entry.max_deg, entry.max_set)
-        start_display = format_value(entry.start_deg, entry.start_set)
-        stop_display = format_value(entry.stop_deg, entry.stop_set)
-        step_display = f"{session.step_deg:.1f}°"
-        status = (
-            f"\033[36mCurrent\033[0m: {session.current_angle:.1f}° | "
-            f"\033[36mStep\033[0m: {step_display} | "
-            f"\033[36mMin\033[0m: {min_display} | "
-            f"\033[36mMax\033[0m: {max_display} | "
-            f"\033[36mStart\033[0m: {start_display} | "
-            f"\033[36mStop\033[0m: {stop_display}"
-        )
-
-        if not status_line_active:
-            sys.stdout.write(status)
-            sys.stdout.flush()
-            status_line_active = True
-        else:
-            sys.stdout.write("\r\033[K" + status)
-            sys.stdout.flush()
-
-        command = key_reader.read_key()
-        cont = session.process_command(command)
-        if not cont:
-            break
+    with KeyReader() as key_reader:
+        while True:
+            entry = session.current_entry
+
+            if entry.channel != last_channel:
+                if status_line_active:
+                    print()
+                    status_line_active = False
+                channel_label = session.channel_label(entry.channel)
+                channel_display = f"Kanal {entry.channel}"
+                if channel_label:
+                    channel_display += f" (\033[92m{channel_label}\033[0m)"
+                print(f"\n\033[1m=== Servo-{channel_display} ===\033[0m")
+                last_channel = entry.channel
+
+            # Keys that change nothing visible (e.g. stepping at a limit) skip the redraw.
+            status_key = (
+                entry.channel,
+                session.current_angle,
+                session.step_deg,
+                entry.min_deg,
+                entry.max_deg,
+                entry.start_deg,
+                entry.stop_deg,
+                entry.min_set,
+                entry.max_set,
+                entry.start_set,
+                entry.stop_set,
+            )
+            if status_key != last_status_key or not status_line_active:
+                status = status_template.format(
+                    session.current_angle,
+                    session.step_deg,
+                    format_value(entry.min_deg, entry.min_set),
+                    format_value(entry.max_deg, entry.max_set),
+                    format_value(entry.start_deg, entry.start_set),
+                    format_value(entry.stop_deg, entry.stop_set),
+                )
+                sys.stdout.write(status if not status_line_active else "\r\033[K" + status)
+                sys.stdout.flush()
+                status_line_active = True
+                last_status_key = status_key
+
+            command = key_reader.read_key()
+            cont = session.process_command(command)
+            if not cont:
+                break
 
     if status_line_active:
         print()
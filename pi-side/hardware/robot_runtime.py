@@ -5,7 +5,7 @@ import importlib.util, logging, os, random, threading, time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Mapping, Optional
 
-from hardware.pca9685_servo import Servo, ServoConfig
+from hardware.pca9685_servo import PCA9685Bus, Servo, ServoConfig, flush_servos
 from hardware.servo_calibration import (
     ServoCalibration,
     load_servo_calibration,
@@ -22,7 +22,8 @@ from hardware.eyelid_controller import EyelidController
 
 try:
     from hardware.xvf_mic import ReSpeakerMic
-    _XVF_MIC_AVAILABLE = True
+    # xvf_mic imports pyusb lazily, so check for it here.
+    _XVF_MIC_AVAILABLE = importlib.util.find_spec("usb") is not None
 except ImportError:
     _XVF_MIC_AVAILABLE = False
 
@@ -58,6 +59,7 @@ else:
 @dataclass(frozen=True)
 class ServoInitBundle:
     pca: Any
+    bus: PCA9685Bus
     servo_map: Dict[str, Servo]
     servo_channel_map: Dict[str, int]
     calibration_map: Dict[int, ServoCalibration]
@@ -162,8 +164,11 @@ def _build_face_tracking_config(logger: logging.Logger) -> "FaceTrackingConfig":
         pitch_max_delta_deg=_float("FACE_TRACKING_PITCH_MAX_DELTA_DEG", base_cfg.pitch_max_delta_deg),
         invoke_interval_s=_float("FACE_TRACKING_INVOKE_INTERVAL_S", base_cfg.invoke_interval_s),
         invoke_timeout_s=_float("FACE_TRACKING_INVOKE_TIMEOUT_S", base_cfg.invoke_timeout_s),
+        idle_invoke_interval_s=_float("FACE_TRACKING_IDLE_INVOKE_INTERVAL_S", base_cfg.idle_invoke_interval_s),
         update_interval_s=_float("FACE_TRACKING_UPDATE_INTERVAL_S", base_cfg.update_interval_s),
         neutral_timeout_s=_float("FACE_TRACKING_NEUTRAL_TIMEOUT_S", base_cfg.neutral_timeout_s),
+        center_smoothing_alpha=_float("FACE_TRACKING_CENTER_SMOOTHING_ALPHA", base_cfg.center_smoothing_alpha),
+        track_iou_threshold=_float("FACE_TRACKING_TRACK_IOU_THRESHOLD", base_cfg.track_iou_threshold),
         wheel_deadzone_deg=_float("FACE_TRACKING_WHEEL_DEADZONE_DEG", base_cfg.wheel_deadzone_deg),
         wheel_follow_delay_s=_float("FACE_TRACKING_WHEEL_FOLLOW_DELAY_S", base_cfg.wheel_follow_delay_s),
         wheel_input_min_deg=_float("FACE_TRACKING_WHEEL_INPUT_MIN_DEG", base_cfg.wheel_input_min_deg),
@@ -338,6 +343,7 @@ def _initialize_all_servos(logger: logging.Logger) -> ServoInitBundle | None:
         i2c = busio.I2C(board.SCL, board.SDA)
         pca = PCA9685(i2c)
         pca.frequency = max(1, int(round(pwm_freq)))
+        bus = PCA9685Bus(pca)
     except Exception as exc:
         logger.error("Servo init failed: PCA9685 init failed: %s", exc)
         return None
@@ -354,6 +360,9 @@ def _initialize_all_servos(logger: logging.Logger) -> ServoInitBundle | None:
         "RWH": "FACE_TRACKING_WHEEL_RIGHT",
     }
 
+    # Each Servo writes its start pulse on construction; collect those writes
+    # and send them as one block. On failure the bus is dropped with the PCA.
+    bus.begin_batch()
     for name, definition in layout.items():
         idx = servo_channel_map.get(name)
         if idx is None:
@@ -368,7 +377,7 @@ def _initialize_all_servos(logger: logging.Logger) -> ServoInitBundle | None:
             env_config = _create_servo_config(prefix, definition.config, pwm_freq, logger=logger)
             calibration = calibration_map.get(idx)
             config = merge_config_with_calibration(env_config, calibration)
-            servo = Servo(pca.channels[idx], config=config)
+            servo = Servo(bus.channel(idx), config=config)
         except Exception as exc:
             logger.error("Servo init failed for %s on channel %d: %s", name, idx, exc)
             try:
@@ -378,6 +387,15 @@ def _initialize_all_servos(logger: logging.Logger) -> ServoInitBundle | None:
             return None
         servo_map[name] = servo
         start_angles[name] = servo.config.neutral_deg
+    try:
+        bus.commit_batch()
+    except Exception as exc:
+        logger.error("Servo init failed: writing start positions failed: %s", exc)
+        try:
+            pca.deinit()
+        except Exception:
+            pass
+        return None
 
     _register_shutdown_targets(servo_map, servo_channel_map, calibration_map)
 
@@ -400,6 +418,7 @@ def _initialize_all_servos(logger: logging.Logger) -> ServoInitBundle | None:
 
     return ServoInitBundle(
         pca=pca,
+        bus=bus,
         servo_map=servo_map,
         servo_channel_map=servo_channel_map,
         calibration_map=calibration_map,
@@ -599,13 +618,20 @@ def _move_servos_to_stop_positions() -> None:
             reason = "preset/env neutral"
         try:
             servo.move_to(target)
-
-
-            servo.update(5.0)
             logger.debug("Parking servo channel %d to %.1f° (%s)", channel, target, reason)
         except Exception as exc:
             logger.debug("Parking servo channel %d failed: %s", channel, exc)
-
+    channels = {id(servo): channel for channel, servo in targets}
+    try:
+        flush_servos(
+            (servo for _, servo in targets),
+            5.0,
+            on_error=lambda servo, exc: logger.debug(
+                "Parking servo channel %d failed: %s", channels[id(servo)], exc
+            ),
+        )
+    except Exception as exc:
+        logger.debug("Parking servos failed: %s", exc)
 
     time.sleep(0.6)
     logger.info("Servos parked, exiting Coglet.")
@@ -904,7 +930,7 @@ def _drive_anim_targets(targets: Mapping[str, float], duration_s: float, stop_ev
     while remaining > 0.0:
         dt = min(step, remaining)
         if stop_event.wait(dt): break
-        for servo in servo_targets: servo.update(dt)
+        flush_servos(servo_targets, dt)
         remaining -= dt
 
 def _personality_neutral_targets() -> Dict[str, float]:
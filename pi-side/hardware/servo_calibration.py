@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import functools
 import json
 import logging
 from pathlib import Path
+import stat
 from typing import Dict, Iterable, Tuple
 
 from hardware.pca9685_servo import ServoConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_LOGGER = logging.getLogger(__name__)
+
 __all__ = [
     "ServoCalibration",
     "apply_calibration_to_config",
@@ -18,7 +29,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServoCalibration:
     """Describe min/max/neutral angles of a servo channel."""
 
@@ -27,42 +38,42 @@ class ServoCalibration:
     max_deg: float
     start_deg: float
     stop_deg: float | None
+    # Neutral and stop angles clamped into the allowed range; the stop angle
+    # falls back to the neutral one when undefined.
+    clamped_start: float = field(init=False, repr=False, compare=False)
+    clamped_stop: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def clamped_start(self) -> float:
-        """Clamp the neutral angle into the allowed range."""
-        return max(self.min_deg, min(self.max_deg, self.start_deg))
+    def __post_init__(self) -> None:
+        clamped_start = max(self.min_deg, min(self.max_deg, self.start_deg))
+        clamped_stop = (
+            clamped_start
+            if self.stop_deg is None
+            else max(self.min_deg, min(self.max_deg, self.stop_deg))
+        )
+        object.__setattr__(self, "clamped_start", clamped_start)
+        object.__setattr__(self, "clamped_stop", clamped_stop)
 
-    @property
-    def clamped_stop(self) -> float:
-        """Clamp the stop angle into the allowed range (if defined)."""
-        if self.stop_deg is None:
-            return self.clamped_start
-        return max(self.min_deg, min(self.max_deg, self.stop_deg))
+
+_MODULE_DIR = Path(__file__).resolve().parent
+_CALIBRATION_FILE_NAMES = ("servo-calibration.json", "servo_calibration.json")
 
 
 def _default_calibration_paths() -> Tuple[Path, ...]:
     """Return default search paths for the calibration file."""
-    module_root = Path(__file__).resolve()
-    repo_root = module_root.parent.parent.parent
-    pi_side_root = module_root.parent.parent
-    hardware_root = module_root.parent
-    base_dirs = (hardware_root, Path.cwd(), repo_root, pi_side_root)
-    names = ("servo-calibration.json", "servo_calibration.json")
-
-    seen = set()
-    paths = []
-    for base_dir in base_dirs:
-        for name in names:
-            candidate = base_dir / name
-            if candidate in seen:
-                continue
-            seen.add(candidate)
-            paths.append(candidate)
-    return tuple(paths)
+    return _calibration_paths_for(Path.cwd())
 
 
-def _parse_entry(raw: object, *, logger: logging.Logger | None) -> ServoCalibration | None:
+@functools.lru_cache(maxsize=4)
+def _calibration_paths_for(cwd: Path) -> Tuple[Path, ...]:
+    # Only the working directory can change between calls; the module-relative
+    # directories are resolved once at import.
+    base_dirs = (_MODULE_DIR, cwd, _MODULE_DIR.parent.parent, _MODULE_DIR.parent)
+    return tuple(
+        dict.fromkeys(base_dir / name for base_dir in base_dirs for name in _CALIBRATION_FILE_NAMES)
+    )
+
+
+def _parse_entry(raw: object, *, logger: logging.Logger) -> ServoCalibration | None:
     if not isinstance(raw, dict):
         return None
     try:
@@ -72,24 +83,21 @@ def _parse_entry(raw: object, *, logger: logging.Logger | None) -> ServoCalibrat
         start_deg = float(raw["start_deg"])
         stop_raw = raw.get("stop_deg")
     except (KeyError, TypeError, ValueError) as exc:
-        if logger:
-            logger.warning("Ignoring invalid servo calibration entry %r: %s", raw, exc)
+        logger.warning("Ignoring invalid servo calibration entry %r: %s", raw, exc)
         return None
     stop_deg: float | None
     try:
         stop_deg = float(stop_raw) if stop_raw is not None else None
     except (TypeError, ValueError) as exc:
-        if logger:
-            logger.warning("Ignoring stop_deg for channel %d: %s", channel, exc)
+        logger.warning("Ignoring stop_deg for channel %d: %s", channel, exc)
         stop_deg = None
     if min_deg >= max_deg:
-        if logger:
-            logger.warning(
-                "Ignoring servo calibration for channel %d: min_deg %.1f must be smaller than max_deg %.1f",
-                channel,
-                min_deg,
-                max_deg,
-            )
+        logger.warning(
+            "Ignoring servo calibration for channel %d: min_deg %.1f must be smaller than max_deg %.1f",
+            channel,
+            min_deg,
+            max_deg,
+        )
         return None
     return ServoCalibration(
         channel=channel,
@@ -100,27 +108,54 @@ def _parse_entry(raw: object, *, logger: logging.Logger | None) -> ServoCalibrat
     )
 
 
+# Calibration already loaded by this process: path -> (stamp, channel map).
+_loaded_calibrations: Dict[Path, Tuple[Tuple[int, int], Dict[int, ServoCalibration]]] = {}
+
+
+def _log_loaded(
+    logger: logging.Logger, path: Path, calibration_map: Dict[int, ServoCalibration]
+) -> None:
+    logger.info(
+        "Loaded servo calibration from %s for channels %s",
+        path,
+        sorted(calibration_map.keys()),
+    )
+
+
 def load_servo_calibration(
     logger: logging.Logger | None = None, *, search_paths: Iterable[Path] | None = None
 ) -> Tuple[Dict[int, ServoCalibration], Path | None]:
-    """Load calibration data if present."""
+    """Load calibration data if present.
+
+    Without an explicit ``logger`` messages go to this module's logger.
+    """
+    if logger is None:
+        logger = _LOGGER
     calibration_map: Dict[int, ServoCalibration] = {}
     paths = tuple(search_paths) if search_paths is not None else _default_calibration_paths()
 
     for path in paths:
-        if not path.is_file():
+        # One stat both checks for a regular file and yields the memo stamp.
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
             continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        loaded = _loaded_calibrations.get(path)
+        if loaded is not None and loaded[0] == stamp:
+            _log_loaded(logger, path, loaded[1])
+            return dict(loaded[1]), path
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _json_loads(path.read_bytes())
         except Exception as exc:
-            if logger:
-                logger.warning("Failed to read servo calibration from %s: %s", path, exc)
+            logger.warning("Failed to read servo calibration from %s: %s", path, exc)
             continue
 
         raw_entries = data.get("servos") if isinstance(data, dict) else None
         if not isinstance(raw_entries, list):
-            if logger:
-                logger.warning("Servo calibration in %s ignored: missing 'servos' list", path)
+            logger.warning("Servo calibration in %s ignored: missing 'servos' list", path)
             continue
 
         for raw in raw_entries:
@@ -130,12 +165,8 @@ def load_servo_calibration(
             calibration_map[entry.channel] = entry
 
         if calibration_map:
-            if logger:
-                logger.info(
-                    "Loaded servo calibration from %s for channels %s",
-                    path,
-                    sorted(calibration_map.keys()),
-                )
+            _loaded_calibrations[path] = (stamp, dict(calibration_map))
+            _log_loaded(logger, path, calibration_map)
             return calibration_map, path
     return calibration_map, None
 
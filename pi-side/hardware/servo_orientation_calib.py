@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import logging
 import time
-
-import board
-import busio
-from adafruit_pca9685 import PCA9685
+from typing import TYPE_CHECKING
 
 from hardware.servo_presets import SERVO_LAYOUT_V1
 from hardware.pca9685_servo import Servo
 from hardware.servo_calibration import load_servo_calibration, apply_calibration_to_config
 
+if TYPE_CHECKING:
+    from adafruit_pca9685 import PCA9685
+
 INTERESTING_SERVOS = ["LID", "MOU", "NPT", "NRL", "EAL", "EAR"]
 
 def build_servo(name: str, pca: PCA9685, calibration_map):
@@ -43,6 +45,11 @@ def main():
     else:
         logger.info("No servo calibration file found; using layout defaults")
 
+    # Hardware libraries are only loaded once the calibration is in place.
+    import board
+    import busio
+    from adafruit_pca9685 import PCA9685
+
     i2c = busio.I2C(board.SCL, board.SDA)
     pca = PCA9685(i2c)
     pca.frequency = 50
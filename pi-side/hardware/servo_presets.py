@@ -36,7 +36,7 @@ __all__ = [
 TRACKING_SERVO_NAMES: tuple[str, ...] = ("EYL", "EYR", "NPT", "LWH", "RWH")
 PERSONALITY_SERVO_NAMES: tuple[str, ...] = ("NRL", "MOU", "EAL", "EAR")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServoDefinition:
     """Definition of a servo in the Coglet setup."""
 
@@ -247,7 +247,8 @@ def apply_pose(servos: Mapping[str, Servo], pose: str | Mapping[str, float]) ->
 def iter_face_tracking_servos(servos: Mapping[str, Servo]) -> Iterable[Servo]:
     """Return the servos relevant for face tracking."""
 
+    get = servos.get
     for key in TRACKING_SERVO_NAMES:
-        servo = servos.get(key)
+        servo = get(key)
         if servo is not None:
             yield servo
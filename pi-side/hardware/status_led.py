@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import atexit
 import os
 from enum import Enum
 from typing import Any
 
-import board
-import neopixel
-
 
 def _env_bool(name: str, default: bool = True) -> bool:
     """
@@ -20,6 +19,10 @@ def _env_bool(name: str, default: bool = True) -> bool:
     return val.strip().lower() in ("1", "true", "yes", "on")
 
 
+# ENABLE_LED is read once at import; pass ``enabled`` to override per instance.
+_LED_DEFAULT_ENABLED = _env_bool("ENABLE_LED", default=True)
+
+
 class CogletState(str, Enum):
     AWAIT_WAKEWORD = "await_wakeword"
     AWAIT_FOLLOWUP = "await_followup"
@@ -29,36 +32,53 @@ class CogletState(str, Enum):
     OFF            = "off"
 
 
+# Colors are constant per state, so they are stored pre-clamped.
+_STATE_COLORS: dict[CogletState, tuple[int, int, int]] = {
+    CogletState.AWAIT_WAKEWORD: (255, 160, 0),
+    CogletState.AWAIT_FOLLOWUP: (180, 0, 255),
+    CogletState.LISTENING: (255, 0, 0),
+    CogletState.THINKING: (0, 0, 255),
+    CogletState.SPEAKING: (0, 255, 0),
+}
+_COLOR_OFF = (0, 0, 0)
+
+
 class StatusLED:
     """Drive a single NeoPixel (WS281x) as Coglet status indicator.
 
     If ENABLE_LED in the environment is set to false/0/off, the LED stays
     off and all calls become no-ops. The default pin is GPIO21 (board.D21),
     matching the verified reference script provided by the user.
+
+    ``board`` and ``neopixel`` are only imported when the LED is enabled.
     """
 
     def __init__(
         self,
-        pixel_pin: Any = board.D21,
+        pixel_pin: Any = None,
         num_pixels: int = 1,
         brightness: float | int = 0.3,
-        pixel_order: Any = neopixel.RGB,
+        pixel_order: Any = None,
         auto_write: bool = False,
         enabled: bool | None = None,
     ) -> None:
-        if enabled is None:
-            self._enabled = _env_bool("ENABLE_LED", default=True)
-        else:
-            self._enabled = enabled
+        self._enabled = _LED_DEFAULT_ENABLED if enabled is None else enabled
 
         self._current_state: CogletState = CogletState.OFF
-        self._pixels: neopixel.NeoPixel | None = None
+        self._pixels: Any = None
 
         if not self._enabled:
             return
 
+        import board
+        import neopixel
+
+        if pixel_pin is None:
+            pixel_pin = board.D21
+        if pixel_order is None:
+            pixel_order = neopixel.RGB
         normalized_brightness = self._normalize_brightness(brightness)
-        resolved_pin = self._resolve_pin(pixel_pin)
+        resolved_pin = self._resolve_pin(board, pixel_pin)
 
         try:
             self._pixels = neopixel.NeoPixel(
@@ -81,48 +101,42 @@ class StatusLED:
         if not self._enabled or self._pixels is None:
             return
 
-        clamped = (
-            max(0, min(255, int(r))),
-            max(0, min(255, int(g))),
-            max(0, min(255, int(b))),
+        self._fill(
+            (
+                max(0, min(255, int(r))),
+                max(0, min(255, int(g))),
+                max(0, min(255, int(b))),
+            )
         )
-        self._pixels.fill(clamped)
-        if not self._pixels.auto_write:
-            self._pixels.show()
+
+    def _fill(self, color: tuple[int, int, int]) -> None:
+        """Show an already clamped color on all pixels."""
+        pixels = self._pixels
+        if pixels is None:
+            return
+        pixels.fill(color)
+        if not pixels.auto_write:
+            pixels.show()
 
 
     def set_state(self, state: CogletState | str) -> None:
         """Set Coglet status and display the matching color."""
-        if isinstance(state, str):
+        if isinstance(state, str) and not isinstance(state, CogletState):
             try:
                 state = CogletState(state.lower())
             except ValueError:
                 state = CogletState.OFF
 
-        self._current_state = state
-
-        if state == CogletState.AWAIT_WAKEWORD:
-
-            self._set_rgb(255, 160, 0)
-        elif state == CogletState.AWAIT_FOLLOWUP:
-
-            self._set_rgb(180, 0, 255)
-        elif state == CogletState.LISTENING:
-
-            self._set_rgb(255, 0, 0)
-        elif state == CogletState.THINKING:
-
-            self._set_rgb(0, 0, 255)
-        elif state == CogletState.SPEAKING:
-
-            self._set_rgb(0, 255, 0)
-        else:
-
+        color = _STATE_COLORS.get(state)
+        if color is None:
             self.off()
+            return
+        self._current_state = state
+        self._fill(color)
 
     def off(self) -> None:
         self._current_state = CogletState.OFF
-        self._set_rgb(0, 0, 0)
+        self._fill(_COLOR_OFF)
 
     @property
     def current_state(self) -> CogletState:
@@ -137,7 +151,7 @@ class StatusLED:
         return max(0.0, min(float(brightness), 1.0))
 
     @staticmethod
-    def _resolve_pin(pixel_pin: Any) -> Any:
+    def _resolve_pin(board: Any, pixel_pin: Any) -> Any:
         """Allow board pin objects or fallback int GPIO numbers."""
         if isinstance(pixel_pin, int):
             board_attr = f"D{pixel_pin}"
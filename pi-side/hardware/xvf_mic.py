@@ -1,20 +1,25 @@
+import array
 import threading
-import time
 import struct
 import os
-import usb.core
-import usb.util
 import logging
 
 
 VID = 0x2886
 PID = 0x0018
 
+# Vendor read of the DOA angle and VAD flag: 1 pad byte, then two uint16.
+# CTRL_IN | CTRL_TYPE_VENDOR | CTRL_RECIPIENT_DEVICE; usb is imported lazily.
+_DOA_VAD_REQUEST_TYPE = 0x80 | 0x40 | 0x00
+_DOA_VAD_STRUCT = struct.Struct('<xHH')
+
 class ReSpeakerMic(threading.Thread):
     def __init__(self, logger=None, debounce_frames=None):
         super().__init__()
         self.logger = logger or logging.getLogger(__name__)
         self._stop_event = threading.Event()
+        # Set by stop() and set_paused() so the poll wait ends immediately.
+        self._wake = threading.Event()
         self.daemon = True
 
 
@@ -34,9 +39,14 @@ class ReSpeakerMic(threading.Thread):
         self.debug_vad = os.getenv("XVF_VAD_DEBUG", "0").strip().lower() in {"1", "true", "yes", "on"}
         self._speech_counter = 0
         self._silence_counter = 0
+        # pyusb fills this buffer in place, so polling does not allocate a new array.
+        self._doa_vad_buf = array.array('B', bytes(_DOA_VAD_STRUCT.size))
 
 
+        self.dev = None
         try:
+            import usb.core
+
             self.dev = usb.core.find(idVendor=VID)
             if self.dev:
                 self.is_connected = True
@@ -50,37 +60,39 @@ class ReSpeakerMic(threading.Thread):
     def set_paused(self, paused: bool):
         """Pausiert den USB-Abruf, um Bandbreite für Audio-Aufnahme freizugeben."""
         self._paused = paused
+        self._wake.set()
 
     def run(self):
         """Hintergrund-Loop"""
         if not self.is_connected:
             return
 
+        buf = self._doa_vad_buf
+        unpack_from = _DOA_VAD_STRUCT.unpack_from
+        size = _DOA_VAD_STRUCT.size
         while not self._stop_event.is_set():
 
             if self._paused:
-                time.sleep(0.2)
+                self._wait(0.2)
                 continue
 
             try:
 
-                ret = self.dev.ctrl_transfer(
-                    usb.util.CTRL_IN | usb.util.CTRL_TYPE_VENDOR | usb.util.CTRL_RECIPIENT_DEVICE,
-                    0, 146, 20, 5, 1000
-                )
-
-                payload = struct.unpack('<xHH', ret)
-                raw_angle = payload[0]
-                raw_vad   = payload[1]
-                is_speech = (raw_vad & 1) == 1
+                read = self.dev.ctrl_transfer(_DOA_VAD_REQUEST_TYPE, 0, 146, 20, buf, 1000)
 
-                self._apply_vad_sample(raw_angle, is_speech)
+                if read == size:
+                    raw_angle, raw_vad = unpack_from(buf)
+                    self._apply_vad_sample(raw_angle, (raw_vad & 1) == 1)
 
             except Exception:
                 pass
 
 
-            time.sleep(self.poll_interval_s)
+            self._wait(self.poll_interval_s)
+
+    def _wait(self, timeout):
+        if self._wake.wait(timeout):
+            self._wake.clear()
 
     def _apply_vad_sample(self, raw_angle, is_speech):
         previous = self.vad_state
@@ -102,8 +114,11 @@ class ReSpeakerMic(threading.Thread):
 
     def stop(self):
         self._stop_event.set()
+        self._wake.set()
         if self.is_connected:
             try:
+                import usb.util
+
                 usb.util.dispose_resources(self.dev)
             except:
                 pass
@@ -66,6 +66,11 @@ try:
 except ImportError:
     email_sender = None
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 
 from hardware.audio import Recorder, SpeechEndpoint, Wakeword, set_global_listen_state
 from command_utils import normalize_command_text as _normalize_command_text
@@ -485,19 +490,50 @@ def _handle_tts_state(tts_id: str, state: str, payload: Dict[str, Any]) -> None:
         anim_talk_stop()
         _clear_tts_tracking(tts_id)
 
+# One-letter state codes of PIPER_STATUS_FORMAT=compact/msgpack status payloads.
+_TTS_STATUS_NAMES = {
+    "R": "READY", "B": "START", "P": "SPEAKING", "D": "DONE",
+    "C": "CANCELLED", "E": "ERROR", "O": "OFFLINE",
+}
+
+def _decode_status_payload(raw: bytes) -> Dict[str, Any]:
+    """Decode a piper status payload sent as JSON or (when msgpack is installed) MessagePack."""
+    if raw[:1] not in (b"{", b"") and msgpack is not None:
+        js = msgpack.unpackb(raw)
+    else:
+        js = json.loads(raw.decode("utf-8", errors="ignore") or "{}")
+    return js if isinstance(js, dict) else {}
+
+def _expand_compact_status(event: Dict[str, Any]) -> Dict[str, Any]:
+    expanded = dict(event)
+    code = expanded.pop("s")
+    expanded["state"] = _TTS_STATUS_NAMES.get(code, code)
+    if "i" in expanded:
+        expanded["id"] = expanded.pop("i")
+    if "t" in expanded:
+        expanded["ts"] = expanded.pop("t")
+    return expanded
+
 def _mqtt_on_message(client, userdata, msg):
     try:
         if msg.topic != TOPIC_STATUS:
             return
-        js = json.loads(msg.payload.decode("utf-8", errors="ignore") or "{}")
-        tts_id = js.get("id") or ""
-        state  = (js.get("state") or "").upper()
-        if not tts_id:
-            return
-        _handle_tts_state(tts_id, state, js)
-        ev = _tts_events.get(tts_id)
-        if ev and state in ("DONE", "CANCELLED", "ERROR"):
-            ev.set()
+        js = _decode_status_payload(msg.payload)
+        # A coalesced status message lists every transition under "events".
+        events = js.get("events")
+        for event in events if isinstance(events, list) else (js,):
+            if not isinstance(event, dict):
+                continue
+            if "s" in event:
+                event = _expand_compact_status(event)
+            tts_id = event.get("id") or ""
+            state  = (event.get("state") or "").upper()
+            if not tts_id:
+                continue
+            _handle_tts_state(tts_id, state, event)
+            ev = _tts_events.get(tts_id)
+            if ev and state in ("DONE", "CANCELLED", "ERROR"):
+                ev.set()
     except Exception as e:
         logger.error("[mqtt] on_message error: %s", e)
 
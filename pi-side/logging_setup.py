@@ -7,6 +7,7 @@ the configuration will only be applied once.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from logging import Logger
@@ -15,6 +16,7 @@ from typing import Optional
 _LOGGER: Optional[Logger] = None
 
 
+@functools.lru_cache(maxsize=1)
 def _determine_level() -> int:
     level_name = os.getenv("LOGLEVEL", "INFO").strip().upper()
     return logging.DEBUG if level_name == "DEBUG" else logging.INFO
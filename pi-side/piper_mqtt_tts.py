@@ -1,18 +1,28 @@
 #!/usr/bin/env python3
 
 
+import collections
 import json
+import logging
 import os
 import queue
+import re
+import selectors
 import subprocess as sp
 import sys
 import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Optional
 
 from logging_setup import get_logger, setup_logging
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 
 try:
     import paho.mqtt.client as mqtt
@@ -39,6 +49,20 @@ MQTT_BASE  = os.getenv("MQTT_BASE", "coglet/tts")
 MQTT_CMD_QOS = 1
 MQTT_STATUS_QOS = 0
 MQTT_FORCE_V311 = os.getenv("MQTT_FORCE_V311", "0").lower() in {"1", "true", "yes", "on"}
+# Window for coalescing START/SPEAKING status events; 0 publishes each one immediately.
+STATUS_BATCH_S = max(0.0, float(os.getenv("PIPER_STATUS_BATCH_MS", "0")) / 1000.0)
+# Wire format of status payloads: "json" (default), "compact" (JSON with the keys
+# s/i/t and one-letter state codes) or "msgpack" (compact keys, MessagePack-encoded).
+# Subscribers have to understand the format chosen here.
+STATUS_FORMAT = os.getenv("PIPER_STATUS_FORMAT", "json").strip().lower()
+if STATUS_FORMAT not in {"json", "compact", "msgpack"}:
+    STATUS_FORMAT = "json"
+if STATUS_FORMAT == "msgpack" and msgpack is None:
+    STATUS_FORMAT = "compact"
+STATUS_CODES = {
+    "READY": "R", "START": "B", "SPEAKING": "P", "DONE": "D",
+    "CANCELLED": "C", "ERROR": "E", "OFFLINE": "O",
+}
 if hasattr(mqtt, "MQTTv5") and not MQTT_FORCE_V311:
     MQTT_PROTOCOL = mqtt.MQTTv5
 else:
@@ -51,8 +75,55 @@ TOPIC_SAY     = f"{MQTT_BASE}/say"
 TOPIC_CANCEL  = f"{MQTT_BASE}/cancel"
 TOPIC_STATUS  = f"{MQTT_BASE}/status"
 
+_COMPACT_STATUS = STATUS_FORMAT != "json"
+_STATUS_KEY, _ID_KEY = ("s", "i") if _COMPACT_STATUS else ("state", "id")
+_STATUS_SEPARATORS = (",", ":") if _COMPACT_STATUS else None
+
+
+def _status_value(state: str) -> str:
+    return STATUS_CODES.get(state, state) if _COMPACT_STATUS else state
+
+
+# Pre-encoded JSON status payloads for the fixed states; "%s" takes the UTF-8 message ID.
+# Built with json.dumps so they match the fallback encoding byte for byte.
+_STATUS_BARE = {
+    state: json.dumps({_STATUS_KEY: _status_value(state)}, separators=_STATUS_SEPARATORS).encode()
+    for state in STATUS_CODES
+}
+_STATUS_WITH_ID = {
+    state: json.dumps(
+        {_STATUS_KEY: _status_value(state), _ID_KEY: "%s"}, separators=_STATUS_SEPARATORS
+    ).encode()
+    for state in STATUS_CODES
+}
+
+# Piper reads one utterance per line, so embedded line breaks become spaces.
+_LINE_BREAKS = str.maketrans({"\n": " ", "\r": " "})
+# Level tags and RTF lines on Piper's stderr; group 1 is None for "real-time factor".
+_STDERR_CLASS_RE = re.compile(rb" \[(error|warning)\]|real-time factor", re.IGNORECASE)
+# Log level by match rank: nothing, real-time factor, [warning], [error].
+_STDERR_LEVELS = (logging.INFO, logging.DEBUG, logging.WARNING, logging.ERROR)
+
+
+def _stderr_level(raw: bytes) -> int:
+    """Log level for one Piper stderr line; the most severe marker anywhere in it wins."""
+    rank = 0
+    for m in _STDERR_CLASS_RE.finditer(raw):
+        tag = m.group(1)
+        if tag is None:
+            found = 1
+        elif tag.lower() == b"error":
+            return logging.ERROR
+        else:
+            found = 2
+        if found > rank:
+            rank = found
+    return _STDERR_LEVELS[rank]
+
 setup_logging()
 logger = get_logger()
+if STATUS_FORMAT == "compact" and os.getenv("PIPER_STATUS_FORMAT", "").strip().lower() == "msgpack":
+    logger.warning("[piper] PIPER_STATUS_FORMAT=msgpack needs the msgpack package; using compact JSON")
 
 
 class PiperPersistent:
@@ -73,6 +144,15 @@ class PiperPersistent:
         except Exception as e:
             logger.error("[piper] Error changing directory: %s", e)
 
+        self._stdin_buf = bytearray()
+        self._stdout_buf = bytearray()
+        self._stdout_sel = selectors.DefaultSelector()
+        self._spawn()
+        self._requests: queue.SimpleQueue[Optional[tuple[str, float, Future]]] = queue.SimpleQueue()
+        self._io_t = threading.Thread(target=self._io_loop, daemon=True)
+        self._io_t.start()
+
+    def _spawn(self):
         cmd = [
             self.bin,
             "--model", self.model,
@@ -86,35 +166,19 @@ class PiperPersistent:
             stdin=sp.PIPE,
             stdout=sp.PIPE,
             stderr=sp.PIPE,
-            text=True,
-            bufsize=1
         )
-        self._stderr_t = threading.Thread(target=self._stderr_reader, daemon=True)
+        # All three pipes are driven through their raw fds (selector/os.read/os.write)
+        # with framing done in userspace, bypassing Python's buffered pipe objects.
+        self._stdin_fd = self.proc.stdin.fileno()
+        self._stdout_fd = self.proc.stdout.fileno()
+        self._stdout_buf.clear()
+        self._stdout_sel.register(self._stdout_fd, selectors.EVENT_READ)
+        self._stderr_t = threading.Thread(
+            target=self._stderr_reader, args=(self.proc.stderr.fileno(),), daemon=True
+        )
         self._stderr_t.start()
-        self._lock = threading.Lock()
-
-    def _stderr_reader(self):
-        try:
-            for line in self.proc.stderr:
-                line = line.rstrip("\n")
-                if not line:
-                    continue
-                low = line.lower()
-                if " [error]" in low:
-                    logger.error("[piper] %s", line)
-                elif " [warning]" in low:
-                    logger.warning("[piper] %s", line)
-                elif "real-time factor" in low:
-                    logger.debug("[piper] %s", line)
-                else:
-                    logger.info("[piper] %s", line)
-        except Exception as e:
-            logger.warning("[piper] Error reading stderr: %s", e)
-
-    def is_alive(self):
-        return self.proc and (self.proc.poll() is None)
 
-    def close(self):
+    def _stop_proc(self):
         try:
             if self.proc and self.proc.poll() is None:
                 self.proc.terminate()
@@ -122,33 +186,126 @@ class PiperPersistent:
                     self.proc.wait(timeout=1.0)
                 except sp.TimeoutExpired:
                     self.proc.kill()
+                    self.proc.wait(timeout=1.0)
         except Exception as e:
             logger.warning("[piper] Error killing process: %s", e)
 
+    def _restart(self):
+        """Replace Piper after a timeout.
+
+        Piper's replies carry no request tag, so a WAV that shows up late (or never)
+        cannot be told apart from the next request's. A fresh process starts in sync.
+        """
+        logger.warning("[piper] no reply in time; restarting piper")
+        self._stdout_sel.unregister(self._stdout_fd)
+        self._stop_proc()
+        self._stderr_t.join(timeout=1.0)
+        for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            try:
+                pipe.close()
+            except Exception:
+                pass
+        self._spawn()
+
+    def _stderr_reader(self, fd):
+        buf = bytearray()
+        try:
+            while True:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                buf += chunk
+                start = 0
+                newline = buf.find(b"\n")
+                while newline >= 0:
+                    self._log_stderr_line(buf[start:newline])
+                    start = newline + 1
+                    newline = buf.find(b"\n", start)
+                del buf[:start]
+            if buf:
+                self._log_stderr_line(buf)
+        except Exception as e:
+            logger.warning("[piper] Error reading stderr: %s", e)
+
+    @staticmethod
+    def _log_stderr_line(raw):
+        level = _stderr_level(raw)
+        if not logger.isEnabledFor(level):
+            return
+        line = raw.decode("utf-8", "ignore").rstrip("\r")
+        if line:
+            logger.log(level, "[piper] %s", line)
+
+    def is_alive(self):
+        return self.proc and (self.proc.poll() is None)
+
+    def close(self):
+        self._stop_proc()
+        self._requests.put(None)
+        self._io_t.join(timeout=1.0)
+        self._stdout_sel.close()
+
     def synth_one(self, text, timeout_sec=20.0):
         """Send one line of text, wait for a *.wav line on stdout, and return its path."""
         if not self.is_alive():
             raise RuntimeError("piper not running")
-
-        with self._lock:
-
+        fut: Future = Future()
+        self._requests.put((text, time.monotonic() + timeout_sec, fut))
+        return fut.result()
+
+    def _io_loop(self):
+        """Serve synth_one requests in order; this thread alone touches Piper's stdin/stdout."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            text, deadline, fut = request
+            if not fut.set_running_or_notify_cancel():
+                continue
             try:
-                self.proc.stdin.write(text.replace("\n", " ") + "\n")
-                self.proc.stdin.flush()
+                self._write_line(text)
+                fut.set_result(self._read_wav_path(deadline))
+            except TimeoutError as e:
+                fut.set_exception(e)
+                try:
+                    self._restart()
+                except Exception as restart_err:
+                    logger.error("[piper] restart failed: %s", restart_err)
             except Exception as e:
-                raise RuntimeError(f"write failed: {e}")
+                fut.set_exception(e)
 
-
-            deadline = time.time() + timeout_sec
-            while time.time() < deadline:
-                line = self.proc.stdout.readline()
-                if not line:
-                    time.sleep(0.01)
-                    continue
-                line = line.strip()
+    def _write_line(self, text):
+        try:
+            out = self._stdin_buf
+            out.clear()
+            out += text.translate(_LINE_BREAKS).encode("utf-8")
+            out.append(0x0A)
+            with memoryview(out) as view:
+                while view:
+                    view = view[os.write(self._stdin_fd, view):]
+        except Exception as e:
+            raise RuntimeError(f"write failed: {e}")
+
+    def _read_wav_path(self, deadline):
+        buf = self._stdout_buf
+        while True:
+            newline = buf.find(b"\n")
+            if newline >= 0:
+                line = buf[:newline].decode("utf-8", errors="replace").strip()
+                del buf[:newline + 1]
                 if line.endswith(".wav") and line.startswith("/"):
                     return line
-            raise TimeoutError("no wav path from piper")
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not self._stdout_sel.select(remaining):
+                break
+            chunk = os.read(self._stdout_fd, 4096)
+            if not chunk:
+                raise RuntimeError("piper closed stdout")
+            buf += chunk
+        raise TimeoutError("no wav path from piper")
 
 
 class Player:
@@ -188,56 +345,210 @@ class Player:
                 self._proc = None
 
 
-say_q: queue.Queue[tuple[str, str]] = queue.Queue()
+class _SayEntry:
+    __slots__ = ("eid", "text", "cancelled")
+
+    def __init__(self, eid: str, text: str):
+        self.eid = eid
+        self.text = text
+        self.cancelled = False
+
+
+class SayQueue:
+    """FIFO of pending utterances with O(1) cancellation by ID.
+
+    Cancelled entries stay in place and are skipped by :meth:`get`.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._items: collections.deque[_SayEntry] = collections.deque()
+        self._by_id: dict[str, list[_SayEntry]] = {}
+
+    def put(self, eid: str, text: str) -> None:
+        entry = _SayEntry(eid, text)
+        with self._cond:
+            self._items.append(entry)
+            self._by_id.setdefault(eid, []).append(entry)
+            self._cond.notify()
+
+    def get(self) -> tuple[str, str]:
+        """Block until a non-cancelled entry is available and return ``(eid, text)``."""
+        with self._cond:
+            while True:
+                while not self._items:
+                    self._cond.wait()
+                entry = self._items.popleft()
+                if entry.cancelled:
+                    # cancel() already dropped it from _by_id; the ID may be in use again.
+                    continue
+                pending = self._by_id.get(entry.eid)
+                if pending is not None:
+                    for i, other in enumerate(pending):
+                        if other is entry:
+                            del pending[i]
+                            break
+                    if not pending:
+                        del self._by_id[entry.eid]
+                return entry.eid, entry.text
+
+    def cancel(self, eid: str) -> bool:
+        """Mark queued entries with ``eid`` as cancelled; True if any were pending."""
+        with self._cond:
+            pending = self._by_id.pop(eid, None)
+            if not pending:
+                return False
+            for entry in pending:
+                entry.cancelled = True
+            return True
+
+
+say_q = SayQueue()
 current_id_lock = threading.Lock()
 current_id: Optional[str] = None
+# Synth/playback pipeline: while current_id plays, the synth thread works on synth_id
+# and parks the finished WAV in the one-slot prefetch. Stage transitions happen
+# under current_id_lock so a cancel always finds an utterance in exactly one stage.
+pipeline_cond = threading.Condition(current_id_lock)
+synth_id: Optional[str] = None
+synth_cancelled = False
+prefetched: Optional[tuple[str, str, float]] = None  # (eid, wav_path, synth seconds)
 recent_ids_lock = threading.Lock()
-recent_ids: dict[str, float] = {}
+# IDs arrive in time order, so expiry and the size cap only ever pop from the left.
+recent_ids_deque: collections.deque[tuple[str, float]] = collections.deque()
+recent_ids_set: set[str] = set()
+RECENT_ID_TTL_S = 60.0
+RECENT_ID_MAX = 256
 
 
 def _remember_id(eid: str) -> bool:
     """Deduplication helper: returns False if ID already processed."""
-    now = time.time()
+    now = time.monotonic()
     with recent_ids_lock:
-
-        for key, ts in list(recent_ids.items()):
-            if now - ts > 60.0:
-                recent_ids.pop(key, None)
-        if eid in recent_ids:
+        while recent_ids_deque and now - recent_ids_deque[0][1] > RECENT_ID_TTL_S:
+            recent_ids_set.discard(recent_ids_deque.popleft()[0])
+        if eid in recent_ids_set:
             return False
-        recent_ids[eid] = now
+        recent_ids_deque.append((eid, now))
+        recent_ids_set.add(eid)
 
-        if len(recent_ids) > 256:
-            oldest = min(recent_ids.items(), key=lambda item: item[1])[0]
-            recent_ids.pop(oldest, None)
+        while len(recent_ids_deque) > RECENT_ID_MAX:
+            recent_ids_set.discard(recent_ids_deque.popleft()[0])
         return True
 
 def publish_status(client: mqtt.Client, state: str, eid: Optional[str] = None,
                    extra: Optional[dict[str, Any]] = None, retain: bool = False) -> None:
-    payload: dict[str, Any] = {"state": state}
-    if eid:
-        payload["id"] = eid
-    if extra:
-        payload.update(extra)
+    if STATUS_FORMAT == "msgpack":
+        client.publish(
+            TOPIC_STATUS,
+            msgpack.packb(_status_payload(state, eid, extra)),
+            qos=MQTT_STATUS_QOS,
+            retain=retain,
+        )
+        return
+    if not extra and state in _STATUS_BARE:
+        if not eid:
+            body = _STATUS_BARE[state]
+        elif isinstance(eid, str) and '"' not in eid and "\\" not in eid and eid.isprintable():  # nothing to escape
+            body = _STATUS_WITH_ID[state] % eid.encode("utf-8")
+        else:
+            body = None
+        if body is not None:
+            client.publish(TOPIC_STATUS, body, qos=MQTT_STATUS_QOS, retain=retain)
+            return
     client.publish(
         TOPIC_STATUS,
-        json.dumps(payload, ensure_ascii=False),
+        json.dumps(
+            _status_payload(state, eid, extra),
+            ensure_ascii=False,
+            separators=_STATUS_SEPARATORS,
+        ),
         qos=MQTT_STATUS_QOS,
         retain=retain,
     )
 
+
+def _status_payload(state: str, eid: Optional[str], extra: Optional[dict[str, Any]]) -> dict[str, Any]:
+    payload: dict[str, Any] = {_STATUS_KEY: _status_value(state)}
+    if eid:
+        payload[_ID_KEY] = eid
+    if extra:
+        payload.update(extra)
+        if _COMPACT_STATUS and "events" in extra:
+            payload["events"] = [
+                {"s": _status_value(ev["state"]), "i": ev["id"], "t": ev["ts"]}
+                for ev in extra["events"]
+            ]
+    return payload
+
+
+class StatusBatcher:
+    """Coalesce non-terminal status events that occur within a short window.
+
+    A flush with several events publishes one message whose ``state``/``id``
+    are those of the last event plus an ``events`` list with all of them; a
+    single event keeps the plain status format. Terminal states must call
+    :meth:`flush` before publishing so the order on the topic is preserved.
+    """
+
+    def __init__(self, client: mqtt.Client, window_s: float = STATUS_BATCH_S):
+        self._client = client
+        self._window_s = window_s
+        self._lock = threading.Lock()
+        self._events: list[dict[str, Any]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, state: str, eid: Optional[str]) -> None:
+        if self._window_s <= 0.0:
+            publish_status(self._client, state, eid)
+            return
+        with self._lock:
+            self._events.append({"state": state, "id": eid, "ts": time.time()})
+            if self._timer is None:
+                self._timer = threading.Timer(self._window_s, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            events, self._events = self._events, []
+            timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            if not events:
+                return
+            last = events[-1]
+            if len(events) == 1:
+                publish_status(self._client, last["state"], last["id"])
+            else:
+                publish_status(self._client, last["state"], last["id"], {"events": events})
+
+
 def _remove_pending(eid: str) -> bool:
-    """Remove entries with a matching ID from the queue."""
-    removed = False
-    with say_q.mutex:
-        items = list(say_q.queue)
-        say_q.queue.clear()
-        for item in items:
-            if item[0] == eid:
-                removed = True
-                continue
-            say_q.queue.append(item)
-    return removed
+    """Cancel queued entries with a matching ID."""
+    return say_q.cancel(eid)
+
+
+def _cancel_synth(eid: str) -> bool:
+    """Flag the utterance being synthesized; the synth thread reports CANCELLED."""
+    global synth_cancelled
+    with pipeline_cond:
+        if synth_id != eid:
+            return False
+        synth_cancelled = True
+        return True
+
+
+def _drop_prefetched(eid: str) -> Optional[str]:
+    """Take a synthesized but not yet playing utterance out of the pipeline; returns its WAV path."""
+    global prefetched
+    with pipeline_cond:
+        if prefetched is None or prefetched[0] != eid:
+            return None
+        wav_path = prefetched[1]
+        prefetched = None
+        pipeline_cond.notify_all()
+        return wav_path
 
 
 def _parse_cancel_payload(payload_str: str) -> Optional[str]:
@@ -269,20 +580,20 @@ def _handle_message(topic, payload_str, userdata):
             text = payload_str
         if not text:
             return
-        if not eid:
-            eid = str(int(time.time() * 1000))
+        # JSON ids may be numbers; everything downstream keys on strings.
+        eid = str(eid) if eid else str(int(time.time() * 1000))
         if not _remember_id(eid):
             logger.info("[piper] duplicate say ignored id=%s", eid)
             return
-        say_q.put((eid, text))
+        say_q.put(eid, text)
 
     elif topic == TOPIC_CANCEL:
         client = userdata.get("client")
         target = _parse_cancel_payload(payload_str)
         cancelled = False
-        active_id: Optional[str]
         with current_id_lock:
-            active_id = current_id
+            playing_id = current_id
+            active_id = current_id or synth_id
         if target is None:
             if active_id:
                 logger.warning("[piper] cancel without id → applying to current utterance")
@@ -291,14 +602,29 @@ def _handle_message(topic, payload_str, userdata):
                 logger.warning("[piper] cancel without id ignored (no active utterance)")
                 return
 
-        if target and active_id and target == active_id:
+        if target and playing_id and target == playing_id:
             userdata["cancel_flag"][0] = True
             userdata["player"].stop()
             cancelled = True
 
+        if target and _cancel_synth(target):
+            cancelled = True
+
+        wav_path = _drop_prefetched(target) if target else None
+        if wav_path is not None:
+            cancelled = True
+            try:
+                os.remove(wav_path)
+            except Exception:
+                logger.warning("Failed to remove wav: %s", wav_path)
+            if client is not None:
+                userdata["status"].flush()
+                publish_status(client, "CANCELLED", target)
+
         if target and _remove_pending(target):
             cancelled = True
             if client is not None:
+                userdata["status"].flush()
                 publish_status(client, "CANCELLED", target)
 
         if not cancelled and target:
@@ -328,38 +654,61 @@ def on_mqtt_message_v1(client, userdata, msg):
     payload = msg.payload.decode("utf-8", errors="ignore").strip()
     _handle_message(topic, payload, userdata)
 
-def worker_loop(client: mqtt.Client, piper: PiperPersistent, player: Player, cancel_flag):
-    global current_id
+def synth_loop(client: mqtt.Client, piper: PiperPersistent, status: StatusBatcher):
+    """Synthesize queued utterances one ahead of playback."""
+    global synth_id, synth_cancelled, prefetched
     while True:
+        with pipeline_cond:
+            while prefetched is not None:
+                pipeline_cond.wait()
         eid, text = say_q.get()
-        try:
-            with current_id_lock:
-                current_id = eid
-            publish_status(client, "START", eid)
-
-
-            cancel_flag[0] = False
+        with pipeline_cond:
+            synth_id = eid
+            synth_cancelled = False
 
-
-            synth_start = time.perf_counter()
+        synth_start = time.perf_counter()
+        try:
+            status.add("START", eid)
             wav_path = piper.synth_one(text, timeout_sec=30.0)
-            synth_end = time.perf_counter()
-
-            if cancel_flag[0]:
-
-                try: os.remove(wav_path)
-                except Exception: pass
-                publish_status(client, "CANCELLED", eid)
-                logger.info(
-                    "[piper] id=%s cancelled during synth (synth=%.3fs)",
-                    eid,
-                    synth_end - synth_start,
-                )
-                continue
-
-
+        except Exception as e:
+            with pipeline_cond:
+                synth_id = None
+            status.flush()
+            publish_status(client, "ERROR", eid, {"reason": str(e)})
+            logger.error("[piper] id=%s failed: %s", eid, e)
+            continue
+        synth_s = time.perf_counter() - synth_start
+
+        with pipeline_cond:
+            synth_id = None
+            cancelled = synth_cancelled
+            if not cancelled:
+                prefetched = (eid, wav_path, synth_s)
+                pipeline_cond.notify_all()
+
+        if cancelled:
+            try: os.remove(wav_path)
+            except Exception: pass
+            status.flush()
+            publish_status(client, "CANCELLED", eid)
+            logger.info("[piper] id=%s cancelled during synth (synth=%.3fs)", eid, synth_s)
+
+
+def worker_loop(client: mqtt.Client, player: Player, cancel_flag, status: StatusBatcher):
+    """Play synthesized utterances handed over by :func:`synth_loop`."""
+    global current_id, prefetched
+    while True:
+        with pipeline_cond:
+            while prefetched is None:
+                pipeline_cond.wait()
+            eid, wav_path, synth_s = prefetched
+            prefetched = None
+            current_id = eid
+            cancel_flag[0] = False
+            pipeline_cond.notify_all()
+        try:
             player.start(wav_path)
-            publish_status(client, "SPEAKING", eid)
+            status.add("SPEAKING", eid)
             speak_start = time.perf_counter()
             ok = player.wait()
             speak_end = time.perf_counter()
@@ -369,33 +718,36 @@ def worker_loop(client: mqtt.Client, piper: PiperPersistent, player: Player, can
                 logger.warning("Failed to remove wav: %s", wav_path)
 
             if cancel_flag[0]:
+                status.flush()
                 publish_status(client, "CANCELLED", eid)
                 logger.info(
                     "[piper] id=%s cancelled during playback (synth=%.3fs, play=%.3fs)",
                     eid,
-                    synth_end - synth_start,
+                    synth_s,
                     speak_end - speak_start,
                 )
             else:
                 if ok:
+                    status.flush()
                     publish_status(client, "DONE", eid)
                     logger.info(
-                        "[piper] id=%s finished (synth=%.3fs, play=%.3fs, total=%.3fs)",
+                        "[piper] id=%s finished (synth=%.3fs, play=%.3fs)",
                         eid,
-                        synth_end - synth_start,
+                        synth_s,
                         speak_end - speak_start,
-                        speak_end - synth_start,
                     )
                 else:
+                    status.flush()
                     publish_status(client, "ERROR", eid, {"reason":"aplay_failed"})
                     logger.error(
                         "[piper] id=%s playback failed (synth=%.3fs, play=%.3fs)",
                         eid,
-                        synth_end - synth_start,
+                        synth_s,
                         speak_end - speak_start,
                     )
 
         except Exception as e:
+            status.flush()
             publish_status(client, "ERROR", eid, {"reason": str(e)})
             logger.error("[piper] id=%s failed: %s", eid, e)
         finally:
@@ -419,6 +771,8 @@ def main():
         client_kwargs["callback_api_version"] = CallbackAPIVersion.VERSION2
     client = mqtt.Client(**client_kwargs)
     userdata["client"] = client
+    status = StatusBatcher(client)
+    userdata["status"] = status
 
     if MQTT_USE_V2 and CallbackAPIVersion is not None:
         client.on_connect = on_mqtt_connect_v2
@@ -434,7 +788,7 @@ def main():
     try:
         client.will_set(
             TOPIC_STATUS,
-            json.dumps({"state": "OFFLINE"}),
+            msgpack.packb({"s": "O"}) if STATUS_FORMAT == "msgpack" else _STATUS_BARE["OFFLINE"],
             qos=MQTT_STATUS_QOS,
             retain=True,
         )
@@ -444,7 +798,8 @@ def main():
     client.connect(MQTT_HOST, MQTT_PORT, keepalive=30)
 
 
-    t = threading.Thread(target=worker_loop, args=(client, piper, player, cancel_flag), daemon=True)
+    threading.Thread(target=synth_loop, args=(client, piper, status), daemon=True).start()
+    t = threading.Thread(target=worker_loop, args=(client, player, cancel_flag, status), daemon=True)
     t.start()
 
     try:
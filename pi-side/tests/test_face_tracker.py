@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from hardware.face_tracker import FaceTracker, FaceTrackingConfig, FaceTrackingServos, _build_patrol_table
+from hardware.grove_vision_ai import FaceDetectionBatch, FaceDetectionBox
+from hardware.pca9685_servo import Servo, ServoConfig
+
+
+class FakeChannel:
+    duty_cycle = 0
+
+
+def _make_tracker(**config) -> FaceTracker:
+    eyes = (Servo(FakeChannel(), config=ServoConfig()),)
+    return FaceTracker(object(), FaceTrackingServos(eyes=eyes), config=FaceTrackingConfig(**config))
+
+
+def test_select_best_box_prefers_score_then_area():
+    tracker = _make_tracker()
+    small = FaceDetectionBox(x=10, y=10, width=10, height=10, score=0.9)
+    large = FaceDetectionBox(x=50, y=50, width=30, height=30, score=0.9)
+    weak = FaceDetectionBox(x=90, y=90, width=60, height=60, score=0.5)
+
+    assert tracker._select_best_box([small, weak, large]) == (large, False)
+    assert tracker._select_best_box([]) == (None, False)
+
+
+def test_select_best_box_keeps_following_overlapping_face():
+    tracker = _make_tracker(track_iou_threshold=0.3)
+    previous = FaceDetectionBox(x=100, y=100, width=40, height=40, score=0.8)
+    same_face = FaceDetectionBox(x=104, y=102, width=40, height=40, score=0.7)
+    other_face = FaceDetectionBox(x=20, y=20, width=40, height=40, score=0.9)
+
+    assert tracker._select_best_box([other_face, same_face], previous) == (same_face, True)
+
+    moved_away = FaceDetectionBox(x=180, y=180, width=40, height=40, score=0.7)
+    assert tracker._select_best_box([other_face, moved_away], previous) == (other_face, False)
+
+
+def test_select_best_box_uses_batch_argmax():
+    tracker = _make_tracker()
+    batch = FaceDetectionBatch.from_raw([[10, 10, 10, 10, 90], [50, 50, 30, 30, 90], [90, 90, 60, 60, 40]])
+
+    best, tracked = tracker._select_best_box(batch)
+
+    assert (best.x, best.width, best.score, tracked) == (50.0, 30.0, 90.0, False)
+
+
+def test_patrol_table_accumulates_hold_times():
+    table, phase2 = _build_patrol_table(FaceTrackingConfig(patrol_range_wheels_deg=10, patrol_range_eyes_deg=20))
+
+    assert table[0] == (0.0, -20.0, 0.0, 0.6)
+    assert table[1][:2] == (10.0, -20.0)
+    assert [row[3] for row in table] == sorted(row[3] for row in table)
+    assert table[-1][:3] == (0.0, 0.0, 0.0)
+    assert abs(table[-1][3] - 9.0) < 1e-9
+    assert table[phase2][:2] == (10.0, 20.0)
+    assert all(row[1] == -20.0 for row in table[:phase2])
+
+
+def test_tracking_state_reflects_last_detection():
+    tracker = _make_tracker()
+    face = FaceDetectionBox(x=160, y=120, width=20, height=20, score=0.9)
+
+    tracker._handle_detection([face], timestamp=12.5)
+
+    assert tracker.tracking_state() == (12.5, face)
+    assert tracker._state_seq % 2 == 0
+
+
+def test_wheel_lut_matches_power_map():
+    tracker = _make_tracker(wheel_power=2.7)
+    cfg = tracker._config
+
+    for eye_target in (-10.0, cfg.wheel_input_min_deg, 47.3, 90.0, 133.9, cfg.wheel_input_max_deg, 400.0):
+        exact = FaceTracker._power_map(
+            eye_target,
+            cfg.wheel_input_min_deg,
+            cfg.wheel_input_max_deg - cfg.wheel_input_min_deg,
+            cfg.wheel_output_min_deg,
+            cfg.wheel_output_max_deg - cfg.wheel_output_min_deg,
+            cfg.wheel_power,
+        )
+        assert abs(tracker._map_eye_to_wheel_target(eye_target) - exact) < 0.05
+
+
+def test_handle_detection_applies_deadzone_gain_and_clamp():
+    tracker = _make_tracker(eye_deadzone_px=10.0, eye_gain_deg_per_px=0.1, eye_max_delta_deg=2.0)
+    eye = tracker._eyes_tuple[0]
+    start = eye.target_deg
+    cx, cy = tracker._frame_center_x, tracker._frame_center_y
+
+    tracker._handle_detection([FaceDetectionBox(x=cx + 5.0, y=cy, width=0, height=0)], timestamp=1.0)
+    assert eye.target_deg == start
+
+    tracker._handle_detection([FaceDetectionBox(x=cx - 50.0, y=cy, width=0, height=0)], timestamp=2.0)
+    assert eye.target_deg == start - 2.0
+
+
+def test_handle_detection_restarts_smoothing_when_switching_faces():
+    tracker = _make_tracker(center_smoothing_alpha=0.4, track_iou_threshold=0.3)
+    first = FaceDetectionBox(x=40, y=40, width=40, height=40, score=0.9)
+    jittered = FaceDetectionBox(x=44, y=40, width=40, height=40, score=0.9)
+    other = FaceDetectionBox(x=150, y=100, width=40, height=40, score=0.9)
+
+    tracker._handle_detection([first], timestamp=1.0)
+    tracker._handle_detection([jittered], timestamp=1.1)
+    assert tracker._ema_cx != tracker._extract_center(jittered)[0]
+
+    tracker._handle_detection([other], timestamp=1.2)
+    assert (tracker._ema_cx, tracker._ema_cy) == tracker._extract_center(other)
+
+
+def test_invoke_interval_backs_off_while_idle_and_resets_on_face():
+    tracker = _make_tracker(invoke_interval_s=0.1, idle_invoke_interval_s=0.5, patrol_enabled=False)
+
+    intervals = []
+    for step in range(8):
+        tracker._process_vision_result([], now=float(step))
+        intervals.append(tracker._dyn_interval)
+
+    assert intervals == sorted(intervals)
+    assert intervals[0] > 0.1
+    assert intervals[-1] == 0.5
+
+    face = FaceDetectionBox(x=110, y=100, width=20, height=20, score=0.9)
+    tracker._process_vision_result([face], now=9.0)
+    assert tracker._dyn_interval == 0.1
+
+
+def test_patrol_start_after_long_idle_restores_invoke_rate():
+    tracker = _make_tracker(
+        invoke_interval_s=0.15, idle_invoke_interval_s=1.0, neutral_timeout_s=2.0, patrol_interval_s=30.0
+    )
+    tracker._last_detection = tracker._last_patrol_finish = 0.0
+
+    # Drive the tracker like _run: the next request goes out one interval after each result.
+    now = 0.0
+    while tracker._patrol_idx is None:
+        now += tracker._dyn_interval
+        tracker._process_vision_result([], now=now)
+    assert tracker._dyn_interval == 0.15
+
+    start = now
+    while tracker._patrol_idx == 0:
+        now += tracker._dyn_interval
+        tracker._process_vision_result([], now=now)
+    assert now - start < tracker._patrol_table[0][3] + 0.15 + 1e-9
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import array
+import fcntl
+import os
+import termios
+import threading
+import time
+
+from hardware.grove_vision_ai import FaceDetectionBatch, FaceDetectionBox, GroveVisionAIClient
+
+
+class FakeSerial:
+    def close(self):
+        pass
+
+
+FRAME = (
+    b'{"type": 1, "name": "INVOKE", "code": 0, '
+    b'"data": {"count": 1, "boxes": [[120, 80, 40, 50, 91, 0]], "image": ""}}'
+)
+
+
+def _client() -> GroveVisionAIClient:
+    return GroveVisionAIClient("fake", serial_instance=FakeSerial())
+
+
+def test_extract_boxes_skips_preamble_and_non_result_frames():
+    client = _client()
+
+    boxes = client._extract_boxes(b'\r\nAT OK {"type": 0, "data": {}}\r\n' + FRAME + b"\r\n")
+
+    assert boxes is not None
+    assert len(boxes) == 1
+    assert (boxes[0].x, boxes[0].y, boxes[0].width, boxes[0].height) == (120.0, 80.0, 40.0, 50.0)
+    assert boxes[0].score == 91.0
+
+
+def test_extract_boxes_reassembles_frames_split_across_chunks():
+    client = _client()
+    split_points = (1, 17, 40, len(FRAME) - 3, len(FRAME) - 1)
+
+    results = []
+    start = 0
+    for end in split_points + (len(FRAME),):
+        results.append(client._extract_boxes(FRAME[start:end]))
+        start = end
+
+    assert all(result is None for result in results[:-1])
+    assert results[-1] is not None
+    assert len(results[-1]) == 1
+
+
+def test_extract_boxes_drops_malformed_frame_and_recovers():
+    client = _client()
+
+    assert client._extract_boxes(b'{"type": 1, "data": {broken}}') is None
+    boxes = client._extract_boxes(FRAME)
+
+    assert boxes is not None and len(boxes) == 1
+
+
+def test_list_payloads_become_face_detection_batch():
+    client = _client()
+
+    boxes = client._extract_boxes(
+        b'{"type": 1, "data": {"boxes": [[10, 20, 30, 40, 80, 0], [50, 60, 10, 10, 95, 0]]}}'
+    )
+
+    assert isinstance(boxes, FaceDetectionBatch)
+    assert len(boxes) == 2
+    assert boxes.xs.tolist() == [10.0, 50.0]
+    assert boxes.best_index() == 1
+    assert [box.score for box in boxes] == [80.0, 95.0]
+
+
+class ScriptedSerial:
+    """Serial fake that delivers scripted chunks once the invoke command was written."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self._pending = b""
+        self.timeout = 0.0
+        self.written = []
+        self.blocking_reads = 0
+        self.read_timeouts = []
+
+    @property
+    def in_waiting(self):
+        return len(self._pending)
+
+    def reset_input_buffer(self):
+        self._pending = b""
+
+    def write(self, data):
+        self.written.append(data)
+
+    def read(self, size):
+        if not self._pending:
+            self.blocking_reads += 1
+            self.read_timeouts.append(self.timeout)
+            if not self._chunks:
+                return b""
+            self._pending = self._chunks.pop(0)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def close(self):
+        pass
+
+
+def test_invoke_once_reads_frame_without_polling_sleep():
+    fake = ScriptedSerial([FRAME[:30], FRAME[30:] + b"\r\n"])
+    client = GroveVisionAIClient("fake", serial_instance=fake)
+
+    boxes = client.invoke_once(timeout=0.5)
+
+    assert fake.written == [GroveVisionAIClient._INVOCATION_COMMAND]
+    assert boxes is not None and len(boxes) == 1
+    assert fake.blocking_reads == 2
+    assert all(0.0 < timeout <= 0.5 for timeout in fake.read_timeouts)
+    assert fake.timeout == 0.0
+
+
+class PipeSerial:
+    """Serial fake backed by a pipe, so the client can wait on its descriptor."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self._read_fd, self._write_fd = os.pipe()
+        self.timeout = 0.0
+        self.timeout_writes = 0
+
+    def __setattr__(self, name, value):
+        if name == "timeout" and "timeout" in self.__dict__:
+            self.__dict__["timeout_writes"] += 1
+        super().__setattr__(name, value)
+
+    def fileno(self):
+        return self._read_fd
+
+    @property
+    def in_waiting(self):
+        buf = array.array("i", [0])
+        fcntl.ioctl(self._read_fd, termios.FIONREAD, buf)
+        return buf[0]
+
+    def reset_input_buffer(self):
+        pass
+
+    def write(self, data):
+        def feed():
+            for chunk in self._chunks:
+                time.sleep(0.01)
+                os.write(self._write_fd, chunk)
+
+        threading.Thread(target=feed, daemon=True).start()
+
+    def read(self, size):
+        return os.read(self._read_fd, size)
+
+    def close(self):
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+def test_invoke_once_waits_on_descriptor_without_touching_timeout():
+    fake = PipeSerial([FRAME[:30], FRAME[30:] + b"\r\n"])
+    client = GroveVisionAIClient("fake", serial_instance=fake)
+
+    boxes = client.invoke_once(timeout=1.0)
+    client.close()
+
+    assert boxes is not None and len(boxes) == 1
+    assert fake.timeout_writes == 0
+
+
+def test_from_payload_accepts_key_aliases_and_defaults():
+    box = FaceDetectionBox.from_payload({"x": 1, "y": 2, "width": 3, "h": 4, "confidence": 77})
+    assert (box.x, box.y, box.width, box.height, box.score) == (1.0, 2.0, 3.0, 4.0, 77.0)
+
+    sparse = FaceDetectionBox.from_payload({"y": 5, "w": 6})
+    assert (sparse.x, sparse.y, sparse.width, sparse.height, sparse.score) == (0.0, 5.0, 6.0, 0.0, None)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import struct
+import threading
+
+import pytest
+
+from hardware.pca9685_servo import PCA9685Bus, Servo, ServoConfig, flush_servos
+
+
+class FakeChannel:
+    def __init__(self, writes, index):
+        self._writes = writes
+        self._index = index
+        self._duty = 0
+
+    @property
+    def duty_cycle(self):
+        return self._duty
+
+    @duty_cycle.setter
+    def duty_cycle(self, value):
+        self._duty = value
+        self._writes.append((self._index, value))
+
+
+class FakeI2CDevice:
+    def __init__(self):
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, buf):
+        self.blocks.append(bytes(buf))
+
+
+class FakePCA:
+    def __init__(self):
+        self.writes = []
+        self.i2c_device = FakeI2CDevice()
+        self.channels = [FakeChannel(self.writes, idx) for idx in range(16)]
+
+
+def test_bus_writes_through_outside_of_batch():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+
+    bus.channel(3).duty_cycle = 0x1234
+
+    assert pca.writes == [(3, 0x1234)]
+    assert pca.i2c_device.blocks == []
+
+
+def test_bus_flushes_batch_as_single_block_write():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+    config = ServoConfig(max_speed_deg_per_s=1000.0, max_accel_deg_per_s2=100000.0)
+    servos = [Servo(bus.channel(idx), config=config) for idx in (0, 1, 2)]
+    pca.writes.clear()
+
+    for servo in servos:
+        servo.move_to(45.0)
+    with bus.batch():
+        for servo in servos:
+            servo.update(0.02)
+        assert pca.i2c_device.blocks == []
+
+    assert pca.writes == []
+    assert len(pca.i2c_device.blocks) == 1
+    block = pca.i2c_device.blocks[0]
+    assert block[0] == 0x06
+    assert len(block) == 1 + 3 * 4
+    registers = struct.unpack("<6H", block[1:])
+    assert registers[0::2] == (0, 0, 0)
+    assert len(set(registers[1::2])) == 1
+
+
+def test_flush_servos_batches_per_bus():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+    config = ServoConfig(max_speed_deg_per_s=1000.0, max_accel_deg_per_s2=100000.0)
+    servos = [Servo(bus.channel(idx), config=config) for idx in (4, 5)]
+    pca.writes.clear()
+
+    for servo in servos:
+        servo.move_to(120.0)
+    flush_servos(servos, 0.02)
+
+    assert pca.writes == []
+    assert len(pca.i2c_device.blocks) == 1
+    assert pca.i2c_device.blocks[0][0] == 0x06 + 4 * 4
+
+
+def test_bus_skips_unchanged_duty_cycle():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+    channel = bus.channel(7)
+
+    channel.duty_cycle = 0x2000
+    channel.duty_cycle = 0x2000
+    with bus.batch():
+        channel.duty_cycle = 0x2000
+
+    assert pca.writes == [(7, 0x2000)]
+    assert pca.i2c_device.blocks == []
+
+
+def test_bus_batch_does_not_capture_other_threads():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+
+    def write_through(index, value):
+        thread = threading.Thread(target=lambda: setattr(bus.channel(index), "duty_cycle", value))
+        thread.start()
+        thread.join()
+
+    with bus.batch():
+        bus.channel(2).duty_cycle = 0x1000
+        write_through(2, 0x1000)
+        write_through(9, 0x3000)
+        assert pca.writes == [(2, 0x1000), (9, 0x3000)]
+
+    assert len(pca.i2c_device.blocks) == 1
+    block = pca.i2c_device.blocks[0]
+    assert block[0] == 0x06 + 2 * 4
+    assert struct.unpack("<2H", block[1:]) == (0, 0x1000 >> 4)
+
+
+def test_bus_retries_write_through_after_failure():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+    channel = bus.channel(2)
+    failing = pca.channels[2]
+
+    class FlakyChannel:
+        calls = 0
+
+        @property
+        def duty_cycle(self):
+            return failing.duty_cycle
+
+        @duty_cycle.setter
+        def duty_cycle(self, value):
+            FlakyChannel.calls += 1
+            if FlakyChannel.calls == 1:
+                raise OSError("I2C NACK")
+            failing.duty_cycle = value
+
+    pca.channels[2] = FlakyChannel()
+
+    with pytest.raises(OSError):
+        channel.duty_cycle = 4000
+    channel.duty_cycle = 4000
+
+    assert pca.writes == [(2, 4000)]
+    assert channel.duty_cycle == 4000
+
+
+def test_bus_resends_batch_after_failed_block_write():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+    config = ServoConfig(max_speed_deg_per_s=1000.0, max_accel_deg_per_s2=100000.0)
+    servos = [Servo(bus.channel(idx), config=config) for idx in (0, 1)]
+    device = pca.i2c_device
+    write = device.write
+    failures = []
+
+    def flaky_write(buf):
+        if not failures:
+            failures.append(bytes(buf))
+            raise OSError("I2C NACK")
+        write(buf)
+
+    device.write = flaky_write
+    for servo in servos:
+        servo.move_to(60.0)
+    with pytest.raises(OSError):
+        flush_servos(servos, 0.02)
+
+    assert device.blocks == []
+    bus.begin_batch()
+    bus.commit_batch()
+
+    assert device.blocks == failures
+    assert bus.channel(0).duty_cycle == servos[0]._last_duty
+
+
+def test_flush_servos_on_error_keeps_updating_other_servos():
+    pca = FakePCA()
+    bus = PCA9685Bus(pca)
+    config = ServoConfig(max_speed_deg_per_s=1000.0, max_accel_deg_per_s2=100000.0)
+
+    class BrokenServo(Servo):
+        def update(self, dt):
+            raise RuntimeError("stuck")
+
+    broken = BrokenServo(bus.channel(0), config=config)
+    healthy = Servo(bus.channel(1), config=config)
+    pca.writes.clear()
+
+    healthy.move_to(60.0)
+    errors = []
+    flush_servos((broken, healthy), 5.0, on_error=lambda servo, exc: errors.append(servo))
+
+    assert errors == [broken]
+    assert healthy.angle_deg == 60.0
+    assert len(pca.i2c_device.blocks) == 1
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from piper_mqtt_tts import (
+    _ID_KEY,
+    _STATUS_SEPARATORS,
+    STATUS_CODES,
+    _status_payload,
+    _stderr_level,
+    publish_status,
+)
+
+
+def test_stderr_level_uses_the_most_severe_marker():
+    assert _stderr_level(b"[2024-01-01 10:00:00.000] [piper] [info] Loaded voice") == logging.INFO
+    assert _stderr_level(b"[2024-01-01 10:00:00.000] [piper] [info] Real-time factor: 0.2") == logging.DEBUG
+    assert _stderr_level(b"[2024-01-01 10:00:00.000] [piper] [WARNING] slow") == logging.WARNING
+    assert _stderr_level(b"[ts] [piper] [warning] retry after [error] x") == logging.ERROR
+    assert _stderr_level(b"[ts] [piper] [info] real-time factor [error] boom") == logging.ERROR
+    assert _stderr_level(b"[ts] [piper] [info] real-time factor then [warning]") == logging.WARNING
+
+
+def test_stderr_level_scans_the_whole_line():
+    line = b"[ts] [piper] [info] " + b"x" * 200 + b" [error] late tag"
+    assert _stderr_level(line) == logging.ERROR
+
+
+class FakeClient:
+    def __init__(self):
+        self.payloads = []
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        self.payloads.append(payload.encode("utf-8") if isinstance(payload, str) else payload)
+
+
+def test_status_templates_match_json_fallback():
+    client = FakeClient()
+    for state in STATUS_CODES:
+        for eid in (None, "utt-1"):
+            publish_status(client, state, eid)
+            expected = json.dumps(
+                _status_payload(state, eid, None), ensure_ascii=False, separators=_STATUS_SEPARATORS
+            ).encode("utf-8")
+            assert client.payloads[-1] == expected
+
+
+def test_status_accepts_ids_that_need_escaping():
+    client = FakeClient()
+    publish_status(client, "DONE", 'say "hi"')
+    assert json.loads(client.payloads[-1])[_ID_KEY] == 'say "hi"'
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from hardware.pca9685_servo import Servo, ServoConfig
+from hardware.servo_presets import POSE_REST, POSE_THINKING_1, apply_pose
+
+
+class FakeChannel:
+    duty_cycle = 0
+
+
+def _servos(*names: str) -> dict[str, Servo]:
+    config = ServoConfig(min_angle_deg=-90.0, max_angle_deg=90.0)
+    return {name: Servo(FakeChannel(), config=config) for name in names}
+
+
+def test_apply_pose_moves_only_available_servos():
+    servos = _servos("NRL", "MOU", "EAL")
+
+    apply_pose(servos, "pose_thinking_1")
+
+    assert {name: servo.target_deg for name, servo in servos.items()} == {
+        name: POSE_THINKING_1[name] for name in servos
+    }
+
+
+def test_apply_pose_falls_back_to_rest_and_accepts_mappings():
+    servos = _servos("NRL", "EAR")
+
+    apply_pose(servos, "no_such_pose")
+    assert servos["NRL"].target_deg == POSE_REST["NRL"]
+
+    apply_pose(servos, {"EAR": -12.5, "LID": 30.0})
+    assert servos["EAR"].target_deg == -12.5
+    assert servos["NRL"].target_deg == POSE_REST["NRL"]
@@ -38,3 +38,25 @@ def test_xvf_vad_requires_consecutive_speech_frames(monkeypatch):
 
     mic._apply_vad_sample(42, False)
     assert mic.get_status() == (False, 42)
+
+
+def test_xvf_run_reads_doa_and_vad_into_reused_buffer(monkeypatch):
+    monkeypatch.setenv("XVF_VAD_START_FRAMES", "1")
+    monkeypatch.setenv("XVF_VAD_POLL_S", "0")
+    mic = ReSpeakerMic(debounce_frames=1)
+    buffers = []
+
+    class FakeDevice:
+        def ctrl_transfer(self, request_type, request, value, index, data, timeout):
+            buffers.append(data)
+            data[:] = type(data)("B", bytes([0, 90, 0, 1, 0]))
+            if len(buffers) == 2:
+                mic._stop_event.set()
+            return len(data)
+
+    mic.dev = FakeDevice()
+    mic.is_connected = True
+    mic.run()
+
+    assert mic.get_status() == (True, 90)
+    assert buffers[0] is buffers[1]